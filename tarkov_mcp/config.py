@@ -11,10 +11,31 @@ class Config:
     # Rate limiting
     MAX_REQUESTS_PER_MINUTE: int = 60
     REQUEST_TIMEOUT: int = 30
+    MAX_CONCURRENT: int = 8
+    MAX_RETRIES: int = 3
+    RETRY_BACKOFF_S: float = 0.5
+    
+    # Connection pooling
+    HTTP_POOL_SIZE: int = 32
+    KEEPALIVE_S: int = 75
+    HTTP2: bool = False
+    RAW_POST: bool = False
+    PERSISTED_QUERIES: bool = False
+    
+    # Query batching (requires server support for JSON-array batches)
+    BATCH_QUERIES: bool = False
+    BATCH_INTERVAL_MS: int = 5
+    BATCH_MAX: int = 10
     
     # Caching
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_ENTRIES: int = 512
+    WARM_CACHE: bool = True
+    CACHE_TTL_STATIC: int = 86400  # 24 hours for maps and hideout
     CACHE_TTL_ITEMS: int = 3600  # 1 hour for items
-    CACHE_TTL_PRICES: int = 300  # 5 minutes for prices
+    CACHE_TTL_PRICES: int = 300  # 5 minutes for prices and traders (resetTime)
+    CACHE_TTL_FLEA: int = 60  # 1 minute for flea market listings
+    CACHE_TTL_REPORTS: int = 30  # 30 seconds for community goon reports
     
     # User agent
     USER_AGENT: str = "TarkovMCPServer/0.1.0"
@@ -37,6 +58,48 @@ class Config:
         if timeout := os.getenv("REQUEST_TIMEOUT"):
             config.REQUEST_TIMEOUT = int(timeout)
             
+        if max_concurrent := os.getenv("MAX_CONCURRENT"):
+            config.MAX_CONCURRENT = int(max_concurrent)
+            
+        if max_retries := os.getenv("MAX_RETRIES"):
+            config.MAX_RETRIES = int(max_retries)
+            
+        if backoff := os.getenv("RETRY_BACKOFF_S"):
+            config.RETRY_BACKOFF_S = float(backoff)
+            
+        if pool_size := os.getenv("HTTP_POOL_SIZE"):
+            config.HTTP_POOL_SIZE = int(pool_size)
+            
+        if keepalive := os.getenv("KEEPALIVE_S"):
+            config.KEEPALIVE_S = int(keepalive)
+            
+        if http2 := os.getenv("HTTP2"):
+            config.HTTP2 = http2.lower() in ("1", "true", "yes")
+            
+        if raw_post := os.getenv("RAW_POST"):
+            config.RAW_POST = raw_post.lower() in ("1", "true", "yes")
+            
+        if persisted := os.getenv("PERSISTED_QUERIES"):
+            config.PERSISTED_QUERIES = persisted.lower() in ("1", "true", "yes")
+            
+        if batch := os.getenv("BATCH_QUERIES"):
+            config.BATCH_QUERIES = batch.lower() in ("1", "true", "yes")
+            
+        if batch_interval := os.getenv("BATCH_INTERVAL_MS"):
+            config.BATCH_INTERVAL_MS = int(batch_interval)
+            
+        if batch_max := os.getenv("BATCH_MAX"):
+            config.BATCH_MAX = int(batch_max)
+            
+        if cache_enabled := os.getenv("CACHE_ENABLED"):
+            config.CACHE_ENABLED = cache_enabled.lower() in ("1", "true", "yes")
+            
+        if cache_max := os.getenv("CACHE_MAX_ENTRIES"):
+            config.CACHE_MAX_ENTRIES = int(cache_max)
+            
+        if warm_cache := os.getenv("WARM_CACHE"):
+            config.WARM_CACHE = warm_cache.lower() in ("1", "true", "yes")
+            
         if log_level := os.getenv("LOG_LEVEL"):
             config.LOG_LEVEL = log_level.upper()
             
@@ -1,106 +1,698 @@
 """GraphQL client for Tarkov API."""
 
 import asyncio
+import hashlib
+import json
+import random
 import time
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, AsyncIterator, FrozenSet, Iterable, Optional, List, Set, Tuple
 from gql import gql, Client
 from gql.transport.aiohttp import AIOHTTPTransport
+from graphql import parse, print_ast
+from gql.transport.exceptions import TransportProtocolError, TransportQueryError, TransportServerError
 import aiohttp
 import logging
 
 from tarkov_mcp.config import config
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    
+    def _json_dumps_str(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps_str = json.dumps
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    import httpx
+    from gql.transport.httpx import HTTPXAsyncTransport
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=64)
+def _compact_query(query: str) -> str:
+    """Collapse the indentation of a query literal; none of our queries contain string values."""
+    return " ".join(query.split())
+
+@lru_cache(maxsize=64)
+def _parse_query(query: str) -> Any:
+    """Parse a query string once; the query literals never change at runtime."""
+    return gql(query)
+
+def _build_variables(**values: Any) -> Dict[str, Any]:
+    """Build query variables in sorted key order, omitting unset (None or empty) values."""
+    return {key: values[key] for key in sorted(values) if values[key] not in (None, "")}
+
+# Upper bound on any single backoff, including server-supplied Retry-After values
+_RETRY_MAX_DELAY = 30.0
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Return how long to wait before retrying after error, or None if it is not transient."""
+    if isinstance(error, TransportServerError):
+        if error.code is not None and error.code != 429 and error.code < 500:
+            return None
+        cause = error.__cause__
+        if error.code == 429 and isinstance(cause, aiohttp.ClientResponseError) and cause.headers:
+            retry_after = cause.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), _RETRY_MAX_DELAY)
+    elif not isinstance(error, (asyncio.TimeoutError, aiohttp.ClientConnectionError)):
+        return None
+    
+    backoff = min(_RETRY_MAX_DELAY, config.RETRY_BACKOFF_S * 2 ** attempt)
+    return backoff + random.uniform(0, config.RETRY_BACKOFF_S)
+
 class RateLimiter:
-    """Simple rate limiter for API requests."""
+    """Token bucket rate limiter for API requests."""
     
     def __init__(self, max_requests: int, time_window: float = 60):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = []
-        self._lock = asyncio.Lock()
+        self._rate = max_requests / time_window  # tokens per second
+        self._tokens = float(max_requests)
+        self._last_refill = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_lock(self) -> asyncio.Lock:
+        """Return the lock for the running event loop, creating it if the loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+    
+    def _refill(self):
+        """Add tokens for the time elapsed since the last refill, up to capacity."""
+        now = time.monotonic()
+        self._tokens = min(self.max_requests, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
     
     async def acquire(self):
         """Acquire permission to make a request."""
-        async with self._lock:
-            now = time.time()
-            # Remove old requests outside the time window
-            self.requests = [req_time for req_time in self.requests if now - req_time < self.time_window]
+        while True:
+            async with self._get_lock():
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self._rate
             
-            if len(self.requests) >= self.max_requests:
-                # Calculate how long to wait
-                oldest_request = min(self.requests)
-                wait_time = self.time_window - (now - oldest_request)
-                if wait_time > 0:
-                    logger.info(f"Rate limit reached, waiting {wait_time:.2f} seconds")
-                    await asyncio.sleep(wait_time)
-                    return await self.acquire()
-            
-            self.requests.append(now)
+            # Sleep without holding the lock so other callers can compute their own wait
+            logger.info(f"Rate limit reached, waiting {wait_time:.2f} seconds")
+            await asyncio.sleep(wait_time)
 
-class TarkovGraphQLClient:
-    """GraphQL client for Tarkov API with rate limiting and error handling."""
+# Shared across all client instances so the per-minute budget holds process-wide
+_rate_limiter: Optional[RateLimiter] = None
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter, creating it on first use."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(config.MAX_REQUESTS_PER_MINUTE)
+    return _rate_limiter
+
+# Caps requests on the wire at once; the rate limiter alone lets a full bucket burst out together
+_request_semaphore: Optional[asyncio.Semaphore] = None
+_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_request_semaphore() -> asyncio.Semaphore:
+    """Return the request concurrency limit for the running event loop, creating it if needed."""
+    global _request_semaphore, _semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _request_semaphore is None or _semaphore_loop is not loop:
+        _request_semaphore = asyncio.Semaphore(config.MAX_CONCURRENT)
+        _semaphore_loop = loop
+    return _request_semaphore
+
+# Shared connection pool so keep-alive connections survive across client instances
+_connector: Optional[aiohttp.TCPConnector] = None
+_connector_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_connector() -> aiohttp.TCPConnector:
+    """Return the shared TCP connector for the running event loop, creating it if needed."""
+    global _connector, _connector_loop
+    loop = asyncio.get_running_loop()
+    if _connector is None or _connector.closed or _connector_loop is not loop:
+        _connector = aiohttp.TCPConnector(
+            limit=config.HTTP_POOL_SIZE,
+            limit_per_host=config.HTTP_POOL_SIZE,
+            keepalive_timeout=config.KEEPALIVE_S,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        _connector_loop = loop
+    return _connector
+
+# Shared HTTP/2 client, used in place of the aiohttp pool when HTTP2 is enabled
+_httpx_client: Optional[Any] = None
+_httpx_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_httpx_client() -> Any:
+    """Return the shared HTTP/2 client for the running event loop, creating it if needed."""
+    global _httpx_client, _httpx_loop
+    loop = asyncio.get_running_loop()
+    if _httpx_client is None or _httpx_client.is_closed or _httpx_loop is not loop:
+        _httpx_client = httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": config.USER_AGENT, "Content-Type": "application/json"},
+            timeout=config.REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=config.HTTP_POOL_SIZE,
+                max_keepalive_connections=config.HTTP_POOL_SIZE,
+                keepalive_expiry=config.KEEPALIVE_S
+            )
+        )
+        _httpx_loop = loop
+    return _httpx_client
+
+class SharedAIOHTTPTransport(AIOHTTPTransport):
+    """aiohttp transport on the shared connector that still closes the session it opened."""
     
-    def __init__(self):
-        self.rate_limiter = RateLimiter(config.MAX_REQUESTS_PER_MINUTE)
-        self._client: Optional[Client] = None
-        self._session: Optional[aiohttp.ClientSession] = None
+    async def close(self):
+        # gql skips session.close() when connector_owner is False; closing the session leaves the connector open
+        if self.session is not None:
+            await self.session.close()
+        self.session = None
+
+if httpx is not None:
+    class SharedHTTPXTransport(HTTPXAsyncTransport):
+        """HTTPX transport that borrows the shared HTTP/2 client instead of opening its own."""
+        
+        async def connect(self):
+            self.client = get_httpx_client()
+        
+        async def close(self):
+            # Leave the shared client, and its multiplexed connection, open for the next query
+            self.client = None
+
+async def close_connector():
+    """Close the shared connection pools. Call once on server shutdown."""
+    global _connector, _connector_loop, _httpx_client, _httpx_loop
+    if _connector is not None and not _connector.closed:
+        await _connector.close()
+    if _httpx_client is not None and not _httpx_client.is_closed:
+        await _httpx_client.aclose()
+    _connector = None
+    _connector_loop = None
+    _httpx_client = None
+    _httpx_loop = None
+
+# ETag and decoded response per request body, so unchanged data can be revalidated with a 304
+_etags: "OrderedDict[bytes, Tuple[str, bytes]]" = OrderedDict()
+
+def _remember_etag(body: bytes, etag: str, response: bytes):
+    """Store the validator for a request body, evicting the oldest entries when full."""
+    _etags[body] = (etag, response)
+    _etags.move_to_end(body)
+    while len(_etags) > config.CACHE_MAX_ENTRIES:
+        _etags.popitem(last=False)
+
+async def _post_json(body: bytes) -> Any:
+    """POST a pre-encoded JSON body over the shared connector and decode the response.
     
-    async def __aenter__(self):
-        """Async context manager entry."""
-        await self._initialize()
-        return self
+    Responses that carry an ETag are remembered and revalidated with If-None-Match,
+    so a 304 reuses the previous body without transferring it again.
+    """
+    headers = {"User-Agent": config.USER_AGENT, "Content-Type": "application/json"}
+    known = _etags.get(body) if config.CACHE_ENABLED else None
+    if known is not None:
+        headers["If-None-Match"] = known[0]
+    timeout = aiohttp.ClientTimeout(total=config.REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(connector=get_connector(), connector_owner=False, timeout=timeout) as session:
+        async with session.post(config.TARKOV_API_URL, data=body, headers=headers) as response:
+            if response.status == 304 and known is not None:
+                _etags.move_to_end(body)
+                return _json_loads(known[1])
+            try:
+                response.raise_for_status()
+            except aiohttp.ClientResponseError as e:
+                # Same shape gql raises, so retry handling treats both paths alike
+                raise TransportServerError(str(e), e.status) from e
+            raw = await response.read()
+            etag = response.headers.get("ETag")
+            if etag and config.CACHE_ENABLED:
+                # Kept encoded; decoding a fresh copy on a 304 is cheaper than deep-copying one
+                _remember_etag(body, etag, raw)
+            return _json_loads(raw)
+
+@lru_cache(maxsize=64)
+def _request_body_prefix(query: str) -> bytes:
+    """Encode the constant part of a request body once per query string."""
+    return b'{"query":' + _json_dumps(query) + b',"variables":'
+
+@lru_cache(maxsize=64)
+def _persisted_query_extension(query: str) -> bytes:
+    """Encode the automatic persisted query extension (and closing brace) once per query string."""
+    digest = hashlib.sha256(query.encode()).hexdigest()
+    return b',"extensions":{"persistedQuery":{"version":1,"sha256Hash":"' + digest.encode() + b'"}}}'
+
+def _persisted_query_error(response: Any) -> Optional[str]:
+    """Return the APQ error code if the server did not resolve a persisted query hash."""
+    for error in response.get("errors") or []:
+        code = (error.get("extensions") or {}).get("code") or error.get("message")
+        if code in ("PERSISTED_QUERY_NOT_FOUND", "PersistedQueryNotFound"):
+            return "not_found"
+        if code in ("PERSISTED_QUERY_NOT_SUPPORTED", "PersistedQueryNotSupported"):
+            return "not_supported"
+    return None
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire after a per-entry TTL."""
     
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self._cleanup()
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
     
-    async def _initialize(self):
-        """Initialize the GraphQL client."""
-        headers = {
-            "User-Agent": config.USER_AGENT,
-            "Content-Type": "application/json"
-        }
-        
-        transport = AIOHTTPTransport(
-            url=config.TARKOV_API_URL,
-            headers=headers,
-            timeout=config.REQUEST_TIMEOUT
-        )
-        
-        self._client = Client(transport=transport, fetch_schema_from_transport=False)
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
     
-    async def _cleanup(self):
-        """Clean up resources."""
-        if self._session:
-            await self._session.close()
+    def set(self, key: Tuple, value: Any, ttl: float):
+        """Store a value, evicting the least recently used entries when full."""
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
     
-    async def execute_query(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Execute a GraphQL query with rate limiting."""
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-        
-        await self.rate_limiter.acquire()
-        
+    def clear(self):
+        """Drop all cached entries."""
+        self._data.clear()
+
+# Shared so repeated tool calls hit the cache regardless of which client made the first request
+_cache: Optional[TTLCache] = None
+
+def get_cache() -> TTLCache:
+    """Return the process-wide query cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = TTLCache(config.CACHE_MAX_ENTRIES)
+    return _cache
+
+class _InFlight:
+    """A query on the wire, and how many identical callers are waiting on its response."""
+    
+    __slots__ = ("future", "waiters")
+    
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+        self.waiters = 0
+
+# Queries currently on the wire, so identical concurrent requests share one response
+_inflight: Dict[Tuple, _InFlight] = {}
+
+# Returned by the batcher when the server rejected a batch and the query must be sent alone
+_UNBATCHED = object()
+
+class QueryBatcher:
+    """Coalesces queries issued within a short window into one JSON-array POST."""
+    
+    def __init__(self, interval: float, max_size: int):
+        self.interval = interval
+        self.max_size = max_size
+        self.enabled = True
+        self._queue: List[Tuple[str, Optional[Dict[str, Any]], asyncio.Future]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+    
+    async def submit(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Any:
+        """Queue a query and wait for its slice of the batched response."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((query, variables, future))
+        if len(self._queue) >= self.max_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+        return await future
+    
+    async def _flush_later(self):
+        """Dispatch whatever has queued up once the batch window closes."""
+        await asyncio.sleep(self.interval)
+        self._timer = None
+        self._dispatch()
+    
+    def _dispatch(self):
+        """Hand the current queue to a send task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._queue = self._queue, []
+        if batch:
+            task = asyncio.create_task(self._send(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+    
+    async def _send(self, batch: List[Tuple[str, Optional[Dict[str, Any]], asyncio.Future]]):
+        """POST a batch and resolve each waiter with its own result."""
         try:
-            gql_query = gql(query)
-            result = await self._client.execute_async(gql_query, variable_values=variables)
-            logger.debug(f"GraphQL query executed successfully. Variables: {variables}")
-            return result
+            payload = [{"query": query, "variables": variables or {}} for query, variables, _ in batch]
+            async with get_request_semaphore():
+                await get_rate_limiter().acquire()
+                responses = await self._post(payload)
         except Exception as e:
-            logger.error(f"GraphQL query failed: {e}. Query variables: {variables}")
-            raise
+            # Possibly transient; send this batch's queries singly but keep batching for later ones
+            logger.warning("Batched request failed, sending this batch as single requests: %s", e)
+            self._unbatch(batch)
+            return
+        
+        if not isinstance(responses, list) or len(responses) != len(batch):
+            logger.warning("Server does not support query batching, falling back to single requests")
+            self.enabled = False
+            self._unbatch(batch)
+            return
+        
+        for (_, _, future), response in zip(batch, responses):
+            if future.done():
+                continue
+            if response.get("errors"):
+                future.set_exception(TransportQueryError(
+                    str(response["errors"][0]),
+                    errors=response["errors"],
+                    data=response.get("data")
+                ))
+            else:
+                future.set_result(response.get("data"))
     
-    async def search_items(self, name: Optional[str] = None, item_type: Optional[str] = None, limit: int = 50, lang: str = "en") -> List[Dict[str, Any]]:
-        """Search for items by name or type."""
-        query = """
-        query SearchItems($name: String, $type: String, $limit: Int, $lang: LanguageCode) {
-            items(name: $name, type: $type, limit: $limit, lang: $lang) {
+    @staticmethod
+    def _unbatch(batch: List[Tuple[str, Optional[Dict[str, Any]], asyncio.Future]]):
+        """Tell each waiter in a batch to send its query on its own."""
+        for _, _, future in batch:
+            if not future.done():
+                future.set_result(_UNBATCHED)
+    
+    async def _post(self, payload: List[Dict[str, Any]]) -> Any:
+        """Send a batched request over the shared connector."""
+        return await _post_json(_json_dumps(payload))
+
+_batcher: Optional[QueryBatcher] = None
+
+def get_batcher() -> QueryBatcher:
+    """Return the process-wide query batcher, creating it on first use."""
+    global _batcher
+    if _batcher is None:
+        _batcher = QueryBatcher(config.BATCH_INTERVAL_MS / 1000, config.BATCH_MAX)
+    return _batcher
+
+# Selection sets shared by several queries; append to any query that spreads them
+_ITEM_PRICE_FRAGMENT = """
+        fragment ItemPriceFields on ItemPrice {
+            vendor {
+                name
+                normalizedName
+            }
+            price
+            currency
+            priceRUB
+            updated
+        }
+        """
+
+_CONTAINED_ITEM_FRAGMENT = """
+        fragment ContainedItemFields on ContainedItem {
+            item {
                 id
                 name
                 shortName
+                iconLink
+                basePrice
+                avg24hPrice
+            }
+            count
+            quantity
+            attributes {
+                name
+                value
+            }
+        }
+        """
+
+# Variable-free reference queries; fetch_bundle can combine any of them into a single request
+_MAPS_QUERY = """
+        query GetMaps {
+            maps {
+                id
+                name
+                description
+                wiki
+                raidDuration
+                players
+                enemies
+                bosses {
+                    name
+                    spawnChance
+                    spawnLocations {
+                        name
+                        chance
+                    }
+                    escorts {
+                        name
+                        amount {
+                            min
+                            max
+                        }
+                    }
+                }
+                extracts {
+                    name
+                    faction
+                    switches {
+                        name
+                    }
+                }
+                loot {
+                    item {
+                        id
+                        name
+                        avg24hPrice
+                    }
+                    spawnChance
+                }
+            }
+        }
+        """
+
+_TRADERS_QUERY = """
+        query GetTraders {
+            traders {
+                id
+                name
+                description
+                location
+                resetTime
+                currency {
+                    name
+                }
+                levels {
+                    level
+                    requiredPlayerLevel
+                    requiredReputation
+                    requiredCommerce
+                    paywall {
+                        level
+                    }
+                }
+                insurance {
+                    availableOnMap
+                    minReturnHour
+                    maxReturnHour
+                    maxStorageTime
+                }
+                repair {
+                    availability
+                    priceModifier
+                    qualityModifier
+                }
+            }
+        }
+        """
+
+# Optional per-level selection sets for get_hideout_modules, keyed by the section names callers pass in `fields`
+_HIDEOUT_LEVEL_FIELDS: Dict[str, str] = {
+    "requirements": """
+                    itemRequirements {
+                        item {
+                            id
+                            name
+                            shortName
+                            iconLink
+                        }
+                        count
+                        quantity
+                        attributes {
+                            name
+                            value
+                        }
+                    }
+                    stationLevelRequirements {
+                        station {
+                            id
+                            name
+                            normalizedName
+                        }
+                        level
+                    }
+                    skillRequirements {
+                        name
+                        level
+                    }
+                    traderRequirements {
+                        trader {
+                            id
+                            name
+                            normalizedName
+                        }
+                        level
+                    }
+""",
+    "crafts": """
+                    crafts {
+                        id
+                        duration
+                        requiredItems {
+                            item {
+                                id
+                                name
+                                shortName
+                            }
+                            count
+                        }
+                        rewardItems {
+                            item {
+                                id
+                                name
+                                shortName
+                            }
+                            count
+                        }
+                    }
+""",
+    "bonuses": """
+                    bonuses {
+                        name
+                        value
+                        type
+                        passive
+                        production
+                        visible
+                    }
+""",
+}
+
+@lru_cache(maxsize=16)
+def _build_hideout_query(fields: FrozenSet[str]) -> str:
+    """Build the hideout stations query selecting the core level fields plus the requested sections."""
+    unknown = fields - _HIDEOUT_LEVEL_FIELDS.keys()
+    if unknown:
+        raise ValueError(f"Unknown hideout fields: {', '.join(sorted(unknown))}")
+    
+    selection = "".join(text for section, text in _HIDEOUT_LEVEL_FIELDS.items() if section in fields)
+    return """
+        query GetHideoutStations {
+            hideoutStations {
+                id
+                name
                 normalizedName
+                imageLink
+                tarkovDataId
+                levels {
+                    level
+                    constructionTime
+                    description""" + selection + """                }
+            }
+        }
+        """
+
+_HIDEOUT_QUERY = _build_hideout_query(frozenset(_HIDEOUT_LEVEL_FIELDS))
+
+_BUNDLE_QUERIES: Dict[str, str] = {
+    "maps": _MAPS_QUERY,
+    "traders": _TRADERS_QUERY,
+    "hideout": _HIDEOUT_QUERY,
+}
+
+# Config TTL per bundle entry; trader lists carry resetTime, which moves every few hours
+_BUNDLE_TTLS: Dict[str, str] = {
+    "maps": "CACHE_TTL_STATIC",
+    "traders": "CACHE_TTL_PRICES",
+    "hideout": "CACHE_TTL_STATIC",
+}
+
+@lru_cache(maxsize=16)
+def _build_bundle_query(names: Tuple[str, ...]) -> str:
+    """Merge the root fields of the named queries into one operation, aliased by name."""
+    fields = []
+    for name in names:
+        operation = parse(_BUNDLE_QUERIES[name]).definitions[0]
+        fields.extend(f"{name}: {print_ast(field)}" for field in operation.selection_set.selections)
+    return "query Bundle {\n" + "\n".join(fields) + "\n}"
+
+def _query_key(query: str, variables: Optional[Dict[str, Any]] = None) -> Tuple:
+    """Cache and in-flight key for a compacted query and its variables."""
+    # List variables (e.g. ids) become tuples so the key stays hashable
+    return (query, tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in (variables or {}).items()
+    )))
+
+# Optional selection sets for get_flea_market_data, keyed by the section names callers pass in `fields`
+_FLEA_MARKET_FIELDS: Dict[str, str] = {
+    "vendors": """
+                sellFor {
+                    source
+                    price
+                    currency
+                    priceRUB
+                }
+""",
+}
+
+@lru_cache(maxsize=8)
+def _build_flea_market_query(fields: FrozenSet[str]) -> str:
+    """Build the flea market query selecting the core price fields plus the requested sections."""
+    unknown = fields - _FLEA_MARKET_FIELDS.keys()
+    if unknown:
+        raise ValueError(f"Unknown flea market fields: {', '.join(sorted(unknown))}")
+    
+    selection = "".join(text for section, text in _FLEA_MARKET_FIELDS.items() if section in fields)
+    return """
+        query GetFleaMarket($limit: Int) {
+            items(limit: $limit) {
+                id
+                name
+                shortName
+                avg24hPrice
+                low24hPrice
+                high24hPrice
+                lastLowPrice
+                changeLast48h
+                changeLast48hPercent
+                updated""" + selection + """            }
+        }
+        """
+
+_FLEA_MARKET_QUERY = _build_flea_market_query(frozenset(_FLEA_MARKET_FIELDS))
+
+# Optional selection sets for search_items, keyed by the section names callers pass in `fields`
+_SEARCH_ITEMS_FIELDS: Dict[str, str] = {
+    "details": """
                 description
                 basePrice
                 weight
@@ -108,6 +700,19 @@ class TarkovGraphQLClient:
                 height
                 gridWidth
                 gridHeight
+                backgroundColor
+                bsgCategoryId
+                updated
+                accuracyModifier
+                recoilModifier
+                ergonomicsModifier
+                hasGrid
+                blocksHeadphones
+                link
+                velocity
+                loudness
+""",
+    "images": """
                 iconLink
                 wikiLink
                 imageLink
@@ -116,8 +721,8 @@ class TarkovGraphQLClient:
                 inspectImageLink
                 image512pxLink
                 image8xLink
-                backgroundColor
-                types
+""",
+    "categories": """
                 category {
                     id
                     name
@@ -128,13 +733,13 @@ class TarkovGraphQLClient:
                     name
                     normalizedName
                 }
-                bsgCategoryId
                 handbookCategories {
                     id
                     name
                     normalizedName
                 }
-                updated
+""",
+    "prices": """
                 avg24hPrice
                 low24hPrice
                 high24hPrice
@@ -143,14 +748,8 @@ class TarkovGraphQLClient:
                 changeLast48h
                 changeLast48hPercent
                 fleaMarketFee
-                accuracyModifier
-                recoilModifier
-                ergonomicsModifier
-                hasGrid
-                blocksHeadphones
-                link
-                velocity
-                loudness
+""",
+    "properties": """
                 properties {
                     ... on ItemPropertiesWeapon {
                         caliber
@@ -330,38 +929,274 @@ class TarkovGraphQLClient:
                         turnPenalty
                     }
                 }
+""",
+    "vendors": """
                 sellFor {
-                    vendor {
-                        name
-                        normalizedName
-                    }
-                    price
-                    currency
-                    priceRUB
-                    updated
+                    ...ItemPriceFields
                 }
                 buyFor {
-                    vendor {
-                        name
-                        normalizedName
-                    }
-                    price
-                    currency
-                    priceRUB
-                    updated
+                    ...ItemPriceFields
                 }
-            }
+""",
+}
+
+@lru_cache(maxsize=32)
+def _build_search_items_query(fields: FrozenSet[str]) -> str:
+    """Build the search_items query selecting the core fields plus the requested sections."""
+    unknown = fields - _SEARCH_ITEMS_FIELDS.keys()
+    if unknown:
+        raise ValueError(f"Unknown search_items fields: {', '.join(sorted(unknown))}")
+    
+    selection = "".join(text for section, text in _SEARCH_ITEMS_FIELDS.items() if section in fields)
+    fragments = _ITEM_PRICE_FRAGMENT if "vendors" in fields else ""
+    return """
+        query SearchItems($name: String, $type: String, $limit: Int, $offset: Int, $lang: LanguageCode) {
+            items(name: $name, type: $type, limit: $limit, offset: $offset, lang: $lang) {
+                id
+                name
+                shortName
+                normalizedName
+                types""" + selection + """            }
         }
-        """
+        """ + fragments
+
+def _items_selection(fields: FrozenSet[str]) -> Tuple[str, str]:
+    """Return the items() selection set and trailing fragments for the given search_items sections."""
+    document = parse(_build_search_items_query(fields))
+    selection = print_ast(document.definitions[0].selection_set.selections[0].selection_set)
+    fragments = "".join("\n" + print_ast(definition) for definition in document.definitions[1:])
+    return selection, fragments
+
+@lru_cache(maxsize=32)
+def _build_search_items_batch_query(count: int, fields: FrozenSet[str]) -> str:
+    """Build one operation with an aliased single-result items() lookup per name."""
+    selection, fragments = _items_selection(fields)
+    variables = "".join(f", $name{i}: String" for i in range(count))
+    lookups = "".join(f"\nitem{i}: items(name: $name{i}, limit: 1, lang: $lang) {selection}" for i in range(count))
+    return f"query SearchItemsBatch($lang: LanguageCode{variables}) {{{lookups}\n}}" + fragments
+
+@lru_cache(maxsize=16)
+def _build_items_by_ids_query(fields: FrozenSet[str]) -> str:
+    """Build an items(ids:) lookup selecting the core fields plus the requested sections."""
+    selection, fragments = _items_selection(fields)
+    return f"query GetItemsByIds($ids: [ID], $lang: LanguageCode) {{\nitems(ids: $ids, lang: $lang) {selection}\n}}" + fragments
+
+class TarkovGraphQLClient:
+    """GraphQL client for Tarkov API with rate limiting and error handling."""
+    
+    def __init__(self):
+        self.rate_limiter = get_rate_limiter()
+        self._client: Optional[Client] = None
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self._initialize()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self._cleanup()
+    
+    async def _initialize(self):
+        """Initialize the GraphQL client."""
+        headers = {
+            "User-Agent": config.USER_AGENT,
+            "Content-Type": "application/json"
+        }
+        
+        transport = self._create_http2_transport() if config.HTTP2 else None
+        if transport is None:
+            transport = SharedAIOHTTPTransport(
+                url=config.TARKOV_API_URL,
+                headers=headers,
+                timeout=config.REQUEST_TIMEOUT,
+                json_serialize=_json_dumps_str,
+                json_deserialize=_json_loads,
+                client_session_args={"connector": get_connector(), "connector_owner": False}
+            )
+        
+        self._client = Client(transport=transport, fetch_schema_from_transport=False)
+    
+    def _create_http2_transport(self) -> Optional[Any]:
+        """Return a transport on the shared HTTP/2 client, or None if httpx[http2] is unavailable."""
+        try:
+            if httpx is None:
+                raise ImportError("httpx is not installed")
+            get_httpx_client()
+        except ImportError as e:
+            logger.warning("HTTP/2 unavailable (%s), falling back to aiohttp", e)
+            config.HTTP2 = False
+            return None
+        return SharedHTTPXTransport(url=config.TARKOV_API_URL, json_deserialize=_json_loads)
+    
+    async def _cleanup(self):
+        """Clean up resources."""
+        if self._client and self._client.transport:
+            # Releases the session only; the shared connector stays open
+            await self._client.transport.close()
+    
+    async def execute_query(self, query: str, variables: Optional[Dict[str, Any]] = None, ttl: Optional[float] = None) -> Dict[str, Any]:
+        """Execute a GraphQL query with rate limiting, caching the result for ttl seconds if given."""
+        if not self._client:
+            raise RuntimeError("Client not initialized. Use async context manager.")
+        
+        query = _compact_query(query)
+        key = _query_key(query, variables)
+        use_cache = bool(ttl) and config.CACHE_ENABLED
+        if use_cache:
+            cached = get_cache().get(key)
+            if cached is not None:
+                logger.debug(f"GraphQL cache hit. Variables: {variables}")
+                return _json_loads(cached)
+        
+        while True:
+            inflight = _inflight.get(key)
+            if inflight is None:
+                break
+            logger.debug(f"Joining in-flight GraphQL query. Variables: {variables}")
+            inflight.waiters += 1
+            try:
+                shared = await asyncio.shield(inflight.future)
+            except asyncio.CancelledError:
+                # The caller that started the request was cancelled, not this one; run it ourselves
+                if inflight.future.cancelled():
+                    continue
+                raise
+            return _json_loads(shared)
+        
+        future = asyncio.get_running_loop().create_future()
+        entry = _inflight[key] = _InFlight(future)
+        try:
+            result = await self._fetch(query, variables)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved in case nobody joined
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            # Waiters and the cache decode their own copy of an encoded snapshot, so the caller can
+            # mutate the result it returns; nothing is encoded when neither needs it
+            shared = _json_dumps(result) if use_cache or entry.waiters else None
+            future.set_result(shared)
+        finally:
+            del _inflight[key]
+        
+        if use_cache:
+            get_cache().set(key, shared, ttl)
+        return result
+    
+    async def _fetch(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a query to the API, batched if enabled, otherwise through gql."""
+        try:
+            result = _UNBATCHED
+            batcher = get_batcher() if config.BATCH_QUERIES else None
+            if batcher is not None and batcher.enabled:
+                result = await batcher.submit(query, variables)
+            
+            if result is _UNBATCHED:
+                result = await self._execute_with_retry(query, variables)
+            logger.debug(f"GraphQL query executed successfully. Variables: {variables}")
+            return result
+        except Exception as e:
+            logger.error(f"GraphQL query failed: {e}. Query variables: {variables}")
+            raise
+    
+    async def _execute_with_retry(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a query, retrying transient failures with exponential backoff."""
+        raw = config.RAW_POST and not config.HTTP2
+        gql_query = None if raw else _parse_query(query)
+        attempt = 0
+        while True:
+            try:
+                async with get_request_semaphore():
+                    await self.rate_limiter.acquire()
+                    if raw:
+                        return await self._post_raw(query, variables)
+                    return await self._client.execute_async(gql_query, variable_values=variables)
+            except Exception as e:
+                delay = _retry_delay(e, attempt) if attempt < config.MAX_RETRIES else None
+                if delay is None:
+                    raise
+                attempt += 1
+                logger.warning("Transient GraphQL error (%s), retry %d/%d in %.2fs", e, attempt, config.MAX_RETRIES, delay)
+                await asyncio.sleep(delay)
+    
+    async def _post_raw(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """POST a query directly, skipping gql's per-call document printing and validation."""
+        variables_json = _json_dumps(variables or {})
+        suffix = b"}"
+        if config.PERSISTED_QUERIES:
+            # Try the hash alone first; the full text is only sent when the server has not seen it
+            suffix = _persisted_query_extension(query)
+            response = await _post_json(b'{"variables":' + variables_json + suffix)
+            error = _persisted_query_error(response)
+            if error is None:
+                return self._unwrap_response(response)
+            if error == "not_supported":
+                logger.warning("Server does not support persisted queries, sending full query text")
+                config.PERSISTED_QUERIES = False
+                suffix = b"}"
         
-        variables = {"limit": limit, "lang": lang}
-        if name:
-            variables["name"] = name
-        if item_type:
-            variables["type"] = item_type
+        response = await _post_json(_request_body_prefix(query) + variables_json + suffix)
+        return self._unwrap_response(response)
+    
+    @staticmethod
+    def _unwrap_response(response: Any) -> Dict[str, Any]:
+        """Return the data of a raw GraphQL response, raising on errors as gql would."""
+        if response.get("errors"):
+            raise TransportQueryError(str(response["errors"][0]), errors=response["errors"], data=response.get("data"))
+        if "data" not in response:
+            raise TransportProtocolError(f"Server did not return a GraphQL result: {response}")
+        return response["data"]
+    
+    async def search_items(self, name: Optional[str] = None, item_type: Optional[str] = None, limit: int = 50, lang: str = "en", fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Search for items by name or type, selecting only the given field sections (default: all)."""
+        return [
+            item
+            async for page in self.search_items_iter(name, item_type, limit=limit, lang=lang, fields=fields, page_size=limit)
+            for item in page
+        ]
+    
+    async def search_items_iter(self, name: Optional[str] = None, item_type: Optional[str] = None, limit: Optional[int] = None, lang: str = "en", fields: Optional[Iterable[str]] = None, page_size: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield matching items one page at a time, up to limit items (default: all)."""
+        query = _build_search_items_query(frozenset(_SEARCH_ITEMS_FIELDS if fields is None else fields))
         
-        result = await self.execute_query(query, variables)
-        return result.get("items", [])
+        fetched = 0
+        while limit is None or fetched < limit:
+            page_limit = page_size if limit is None else min(page_size, limit - fetched)
+            variables = _build_variables(limit=page_limit, offset=fetched, lang=lang, name=name, type=item_type)
+            result = await self.execute_query(query, variables, ttl=config.CACHE_TTL_PRICES)
+            page = result.get("items") or []
+            if page:
+                yield page
+            if len(page) < page_limit:
+                break
+            fetched += len(page)
+    
+    async def search_items_batch(self, names: List[str], lang: str = "en", fields: Optional[Iterable[str]] = None) -> List[Optional[Dict[str, Any]]]:
+        """Look up the best match for each name in a single aliased request, in input order."""
+        if not names:
+            return []
+        
+        query = _build_search_items_batch_query(len(names), frozenset(_SEARCH_ITEMS_FIELDS if fields is None else fields))
+        variables = _build_variables(lang=lang, **{f"name{i}": name for i, name in enumerate(names)})
+        result = await self.execute_query(query, variables, ttl=config.CACHE_TTL_PRICES)
+        return [next(iter(result.get(f"item{i}") or ()), None) for i in range(len(names))]
+    
+    async def get_items_by_ids(self, item_ids: List[str], lang: str = "en", fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Fetch several items by ID in one request, selecting only the requested search_items sections.
+        
+        Results follow the order of item_ids; IDs the API does not know are left out.
+        """
+        if not item_ids:
+            return []
+        
+        query = _build_items_by_ids_query(frozenset(_SEARCH_ITEMS_FIELDS if fields is None else fields))
+        result = await self.execute_query(query, {"ids": list(item_ids), "lang": lang}, ttl=config.CACHE_TTL_PRICES)
+        by_id = {item.get("id"): item for item in result.get("items") or ()}
+        return [by_id[item_id] for item_id in item_ids if item_id in by_id]
     
     async def get_item_by_id(self, item_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed item information by ID."""
@@ -498,24 +1333,10 @@ class TarkovGraphQLClient:
                     }
                 }
                 sellFor {
-                    vendor {
-                        name
-                        normalizedName
-                    }
-                    price
-                    currency
-                    priceRUB
-                    updated
+                    ...ItemPriceFields
                 }
                 buyFor {
-                    vendor {
-                        name
-                        normalizedName
-                    }
-                    price
-                    currency
-                    priceRUB
-                    updated
+                    ...ItemPriceFields
                 }
                 usedInTasks {
                     id
@@ -561,37 +1382,19 @@ class TarkovGraphQLClient:
                 }
             }
         }
-        """
+        """ + _ITEM_PRICE_FRAGMENT
         
-        result = await self.execute_query(query, {"id": item_id})
+        result = await self.execute_query(query, {"id": item_id}, ttl=config.CACHE_TTL_PRICES)
         return result.get("item")
     
-    async def get_flea_market_data(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get current flea market data."""
-        query = """
-        query GetFleaMarket($limit: Int) {
-            items(limit: $limit) {
-                id
-                name
-                shortName
-                avg24hPrice
-                low24hPrice
-                high24hPrice
-                lastLowPrice
-                changeLast48h
-                changeLast48hPercent
-                updated
-                sellFor {
-                    source
-                    price
-                    currency
-                    priceRUB
-                }
-            }
-        }
-        """
+    async def get_flea_market_data(self, limit: int = 100, fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Get current flea market data.
         
-        result = await self.execute_query(query, {"limit": limit})
+        `fields` picks which optional sections to fetch ("vendors"); None
+        fetches all of them.
+        """
+        query = _FLEA_MARKET_QUERY if fields is None else _build_flea_market_query(frozenset(fields))
+        result = await self.execute_query(query, {"limit": limit}, ttl=config.CACHE_TTL_FLEA)
         return result.get("items", [])
     
     async def get_barters(self, limit: int = 50) -> List[Dict[str, Any]]:
@@ -610,36 +1413,10 @@ class TarkovGraphQLClient:
                 buyLimit
                 buyLimitResetTime
                 requiredItems {
-                    item {
-                        id
-                        name
-                        shortName
-                        iconLink
-                        basePrice
-                        avg24hPrice
-                    }
-                    count
-                    quantity
-                    attributes {
-                        name
-                        value
-                    }
+                    ...ContainedItemFields
                 }
                 rewardItems {
-                    item {
-                        id
-                        name
-                        shortName
-                        iconLink
-                        basePrice
-                        avg24hPrice
-                    }
-                    count
-                    quantity
-                    attributes {
-                        name
-                        value
-                    }
+                    ...ContainedItemFields
                 }
                 taskUnlock {
                     id
@@ -650,58 +1427,14 @@ class TarkovGraphQLClient:
                 }
             }
         }
-        """
+        """ + _CONTAINED_ITEM_FRAGMENT
         
-        result = await self.execute_query(query, {"limit": limit})
+        result = await self.execute_query(query, {"limit": limit}, ttl=config.CACHE_TTL_ITEMS)
         return result.get("barters", [])
     
     async def get_maps(self) -> List[Dict[str, Any]]:
         """Get all available maps."""
-        query = """
-        query GetMaps {
-            maps {
-                id
-                name
-                description
-                wiki
-                raidDuration
-                players
-                enemies
-                bosses {
-                    name
-                    spawnChance
-                    spawnLocations {
-                        name
-                        chance
-                    }
-                    escorts {
-                        name
-                        amount {
-                            min
-                            max
-                        }
-                    }
-                }
-                extracts {
-                    name
-                    faction
-                    switches {
-                        name
-                    }
-                }
-                loot {
-                    item {
-                        id
-                        name
-                        avg24hPrice
-                    }
-                    spawnChance
-                }
-            }
-        }
-        """
-        
-        result = await self.execute_query(query)
+        result = await self.execute_query(_MAPS_QUERY, ttl=config.CACHE_TTL_STATIC)
         return result.get("maps", [])
     
     async def get_map_by_name(self, name: str) -> Optional[Dict[str, Any]]:
@@ -750,48 +1483,14 @@ class TarkovGraphQLClient:
         }
         """
         
-        result = await self.execute_query(query, {"name": name})
+        result = await self.execute_query(query, {"name": name}, ttl=config.CACHE_TTL_STATIC)
         maps = result.get("maps", [])
         return maps[0] if maps else None
     
     async def get_traders(self) -> List[Dict[str, Any]]:
         """Get all traders."""
-        query = """
-        query GetTraders {
-            traders {
-                id
-                name
-                description
-                location
-                resetTime
-                currency {
-                    name
-                }
-                levels {
-                    level
-                    requiredPlayerLevel
-                    requiredReputation
-                    requiredCommerce
-                    paywall {
-                        level
-                    }
-                }
-                insurance {
-                    availableOnMap
-                    minReturnHour
-                    maxReturnHour
-                    maxStorageTime
-                }
-                repair {
-                    availability
-                    priceModifier
-                    qualityModifier
-                }
-            }
-        }
-        """
-        
-        result = await self.execute_query(query)
+        # resetTime changes within hours, so traders expire with prices rather than static data
+        result = await self.execute_query(_TRADERS_QUERY, ttl=config.CACHE_TTL_PRICES)
         return result.get("traders", [])
     
     async def get_trader_by_name(self, name: str) -> Optional[Dict[str, Any]]:
@@ -831,7 +1530,7 @@ class TarkovGraphQLClient:
         }
         """
         
-        result = await self.execute_query(query, {"name": name})
+        result = await self.execute_query(query, {"name": name}, ttl=config.CACHE_TTL_PRICES)
         traders = result.get("traders", [])
         return traders[0] if traders else None
     
@@ -863,11 +1562,9 @@ class TarkovGraphQLClient:
         }
         """
         
-        variables = {"trader": trader_name}
-        if level:
-            variables["level"] = level
-        
-        result = await self.execute_query(query, variables)
+        # $trader is non-null, so it is always sent (even empty); only the optional level is pruned
+        variables = {**_build_variables(level=level or None), "trader": trader_name}
+        result = await self.execute_query(query, variables, ttl=config.CACHE_TTL_PRICES)
         traders = result.get("traders", [])
         if traders:
             return traders[0].get("cashOffers", [])
@@ -895,11 +1592,8 @@ class TarkovGraphQLClient:
         }
         """
         
-        variables = {}
-        if trader:
-            variables["trader"] = trader
-        
-        result = await self.execute_query(query, variables)
+        variables = _build_variables(trader=trader)
+        result = await self.execute_query(query, variables, ttl=config.CACHE_TTL_ITEMS)
         return result.get("tasks", [])
     
     async def get_quest_by_id(self, quest_id: str) -> Optional[Dict[str, Any]]:
@@ -959,7 +1653,7 @@ class TarkovGraphQLClient:
         }
         """
         
-        result = await self.execute_query(query, {"id": quest_id})
+        result = await self.execute_query(query, {"id": quest_id}, ttl=config.CACHE_TTL_ITEMS)
         return result.get("task")
     
     async def search_quests(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -979,7 +1673,7 @@ class TarkovGraphQLClient:
         }
         """
         
-        result = await self.execute_query(gql_query, {"name": query, "limit": limit})
+        result = await self.execute_query(gql_query, {"name": query, "limit": limit}, ttl=config.CACHE_TTL_ITEMS)
         return result.get("tasks", [])
     
     async def get_ammo_data(self, caliber: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
@@ -1005,97 +1699,39 @@ class TarkovGraphQLClient:
         }
         """
         
-        variables = {"limit": limit}
-        if caliber:
-            variables["caliber"] = caliber
-        
-        result = await self.execute_query(query, variables)
+        variables = _build_variables(limit=limit, caliber=caliber)
+        result = await self.execute_query(query, variables, ttl=config.CACHE_TTL_ITEMS)
         return result.get("ammo", [])
     
-    async def get_hideout_modules(self) -> List[Dict[str, Any]]:
-        """Get hideout modules/stations."""
-        query = """
-        query GetHideoutStations {
-            hideoutStations {
-                id
-                name
-                normalizedName
-                imageLink
-                tarkovDataId
-                levels {
-                    level
-                    constructionTime
-                    description
-                    itemRequirements {
-                        item {
-                            id
-                            name
-                            shortName
-                            iconLink
-                        }
-                        count
-                        quantity
-                        attributes {
-                            name
-                            value
-                        }
-                    }
-                    stationLevelRequirements {
-                        station {
-                            id
-                            name
-                            normalizedName
-                        }
-                        level
-                    }
-                    skillRequirements {
-                        name
-                        level
-                    }
-                    traderRequirements {
-                        trader {
-                            id
-                            name
-                            normalizedName
-                        }
-                        level
-                    }
-                    crafts {
-                        id
-                        duration
-                        requiredItems {
-                            item {
-                                id
-                                name
-                                shortName
-                            }
-                            count
-                        }
-                        rewardItems {
-                            item {
-                                id
-                                name
-                                shortName
-                            }
-                            count
-                        }
-                    }
-                    bonuses {
-                        name
-                        value
-                        type
-                        passive
-                        production
-                        visible
-                    }
-                }
-            }
-        }
-        """
+    async def get_hideout_modules(self, fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Get hideout modules/stations.
         
-        result = await self.execute_query(query)
+        `fields` picks which level sections to fetch ("requirements", "crafts",
+        "bonuses"); None fetches all of them.
+        """
+        query = _HIDEOUT_QUERY if fields is None else _build_hideout_query(frozenset(fields))
+        result = await self.execute_query(query, ttl=config.CACHE_TTL_STATIC)
         return result.get("hideoutStations", [])
 
+    async def fetch_bundle(self, *names: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch several reference lists (maps, traders, hideout) in one aliased request."""
+        unknown = set(names) - _BUNDLE_QUERIES.keys()
+        if unknown:
+            raise ValueError(f"Unknown bundle entries: {', '.join(sorted(unknown))}")
+        
+        names = tuple(sorted(set(names)))
+        ttls = {name: getattr(config, _BUNDLE_TTLS[name]) for name in names}
+        result = await self.execute_query(_build_bundle_query(names), ttl=min(ttls.values()))
+        
+        # Seed the single-query cache entries so get_maps() etc. are served without another request
+        if config.CACHE_ENABLED:
+            for name in names:
+                query = _compact_query(_BUNDLE_QUERIES[name])
+                root = parse(query).definitions[0].selection_set.selections[0].name.value
+                get_cache().set(_query_key(query), _json_dumps({root: result.get(name)}), ttls[name])
+        
+        return {name: result.get(name) or [] for name in names}
+    
     async def get_crafts(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get all crafting recipes."""
         query = """
@@ -1111,43 +1747,17 @@ class TarkovGraphQLClient:
                 duration
                 unlockLevel
                 requiredItems {
-                    item {
-                        id
-                        name
-                        shortName
-                        iconLink
-                        basePrice
-                        avg24hPrice
-                    }
-                    count
-                    quantity
-                    attributes {
-                        name
-                        value
-                    }
+                    ...ContainedItemFields
                 }
                 rewardItems {
-                    item {
-                        id
-                        name
-                        shortName
-                        iconLink
-                        basePrice
-                        avg24hPrice
-                    }
-                    count
-                    quantity
-                    attributes {
-                        name
-                        value
-                    }
+                    ...ContainedItemFields
                 }
             }
         }
-        """
+        """ + _CONTAINED_ITEM_FRAGMENT
         
         variables = {"limit": limit}
-        result = await self.execute_query(query, variables)
+        result = await self.execute_query(query, variables, ttl=config.CACHE_TTL_ITEMS)
         return result.get("crafts", [])
 
     async def get_quest_items(self, limit: int = 50, lang: str = "en") -> List[Dict[str, Any]]:
@@ -1192,7 +1802,7 @@ class TarkovGraphQLClient:
         """
         
         variables = {"limit": limit, "lang": lang}
-        result = await self.execute_query(query, variables)
+        result = await self.execute_query(query, variables, ttl=config.CACHE_TTL_ITEMS)
         return result.get("questItems", [])
 
     async def get_goon_reports(self, limit: int = 20) -> List[Dict[str, Any]]:
@@ -1214,5 +1824,16 @@ class TarkovGraphQLClient:
         """
         
         variables = {"limit": limit}
-        result = await self.execute_query(query, variables)
+        result = await self.execute_query(query, variables, ttl=config.CACHE_TTL_REPORTS)
         return result.get("goonReports", [])
+
+async def warm_cache():
+    """Prefetch rarely-changing reference data into the query cache."""
+    if not config.CACHE_ENABLED:
+        return
+    try:
+        async with TarkovGraphQLClient() as client:
+            await client.fetch_bundle("maps", "traders")
+        logger.info("Query cache warmed with maps and traders")
+    except Exception as e:
+        logger.warning("Cache warm-up failed: %s", e)
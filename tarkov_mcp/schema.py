@@ -6,10 +6,16 @@ Based on the GraphQL schema from:
 https://github.com/the-hideout/tarkov-api/blob/8f3e3a866fd83a62bf7981d613fadbcf8c92679f/schema-static.mjs
 """
 
+from __future__ import annotations
+
+import sys
 from typing import Optional, List, Union, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 
+# Slotted instances drop the per-instance __dict__; dataclass(slots=True) needs Python 3.10+
+_DC_KWARGS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class Side(Enum):
     """Game faction or player type."""
@@ -143,7 +149,7 @@ class RequirementType(Enum):
     HIDEOUT_STATION = "hideoutStation"
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class Achievement:
     """In-game achievements players can earn by completing specific objectives."""
     
@@ -161,7 +167,7 @@ class Achievement:
 
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class ItemSlot:
     """Item slot configuration."""
     id: str
@@ -171,13 +177,13 @@ class ItemSlot:
     required: Optional[bool] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class ItemProperties:
     """Base class for item-specific properties."""
     pass
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class WeaponProperties(ItemProperties):
     """Weapon-specific properties."""
     caliber: Optional[str] = None
@@ -199,7 +205,7 @@ class WeaponProperties(ItemProperties):
     convergence: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class ArmorMaterial:
     """Material properties for armor items."""
     
@@ -213,7 +219,7 @@ class ArmorMaterial:
     max_repair_kit_degradation: Optional[float]
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class ArmorProperties(ItemProperties):
     """Armor-specific properties."""
     class_: Optional[int] = None
@@ -227,14 +233,14 @@ class ArmorProperties(ItemProperties):
     turn_penalty: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class ContainerProperties(ItemProperties):
     """Container-specific properties."""
     capacity: Optional[int] = None
     grids: Optional[List[Dict[str, Any]]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class FoodDrinkProperties(ItemProperties):
     """Food and drink properties."""
     energy: Optional[int] = None
@@ -242,7 +248,7 @@ class FoodDrinkProperties(ItemProperties):
     stim_effects: Optional[List[Dict[str, Any]]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class GrenadeProperties(ItemProperties):
     """Grenade properties."""
     type_: Optional[str] = None
@@ -253,7 +259,7 @@ class GrenadeProperties(ItemProperties):
     contusion_radius: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class HelmetProperties(ItemProperties):
     """Helmet properties."""
     class_: Optional[int] = None
@@ -269,13 +275,13 @@ class HelmetProperties(ItemProperties):
     slots: Optional[List[ItemSlot]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class KeyProperties(ItemProperties):
     """Key properties."""
     uses: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class MedicalProperties(ItemProperties):
     """Medical item properties."""
     uses: Optional[int] = None
@@ -283,7 +289,7 @@ class MedicalProperties(ItemProperties):
     cures: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class StimulantsProperties(ItemProperties):
     """Stimulant properties."""
     uses: Optional[int] = None
@@ -292,7 +298,7 @@ class StimulantsProperties(ItemProperties):
     stim_effects: Optional[List[Dict[str, Any]]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class Item:
     """Base item type with comprehensive properties."""
     id: str
@@ -353,7 +359,7 @@ class Item:
     translation: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class Ammo:
     """Ammunition item with ballistic properties."""
     
@@ -380,13 +386,13 @@ class Ammo:
     stamina_burn_per_damage: Optional[float]
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class NumberCompare:
     """Comparison operator for numeric thresholds."""
     pass  # Would contain comparison logic
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class AttributeThreshold:
     """Attribute requirement threshold."""
     
@@ -394,7 +400,7 @@ class AttributeThreshold:
     requirement: NumberCompare
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class TraderLevel:
     """Trader loyalty level information."""
     level: int
@@ -407,7 +413,7 @@ class TraderLevel:
     standing: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class TraderCashOffer:
     """Trader cash offer information."""
     item: Item
@@ -418,7 +424,7 @@ class TraderCashOffer:
     updated: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class Trader:
     """NPC trader information."""
     id: str
@@ -437,7 +443,7 @@ class Trader:
     cash_offers: Optional[List[TraderCashOffer]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class TaskObjective:
     """Task objective information."""
     id: str
@@ -455,7 +461,7 @@ class TaskObjective:
     zones: Optional[List[Dict[str, Any]]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class TaskRewards:
     """Task reward information."""
     experience: Optional[int] = None
@@ -467,7 +473,7 @@ class TaskRewards:
     trader_unlock: Optional[List[Trader]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class TaskRequirement:
     """Task requirement information."""
     level: Optional[int] = None
@@ -475,7 +481,7 @@ class TaskRequirement:
     prerequisite_tasks: Optional[List[List['Task']]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class Task:
     """Quest/task information."""
     id: str
@@ -504,7 +510,7 @@ class Task:
     note: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class ContainedItem:
     """Item with quantity information."""
     item: Optional[Item]
@@ -513,13 +519,13 @@ class ContainedItem:
     attributes: Optional[List[dict]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class PriceRequirement:
     """Deprecated - use level instead."""
     pass
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class Craft:
     """Hideout crafting recipe."""
     id: str
@@ -533,7 +539,7 @@ class Craft:
     unlock_level: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class Barter:
     """Trading exchange with NPCs."""
     
@@ -550,7 +556,7 @@ class Barter:
     buy_limit_reset_time: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class MobInfo:
     """Information about AI enemies/bosses."""
     id: str
@@ -563,7 +569,7 @@ class MobInfo:
     image_poster_link: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class MapSwitch:
     """Map switch/lever information."""
     id: str
@@ -573,7 +579,7 @@ class MapSwitch:
     operation: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class BossSpawnLocation:
     """Location where boss can spawn."""
     name: str
@@ -581,7 +587,7 @@ class BossSpawnLocation:
     position: Optional[dict] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class BossEscort:
     """Boss escort/bodyguard information."""
     
@@ -589,7 +595,7 @@ class BossEscort:
     description: Optional[str]  # Deprecated - use lang argument on queries
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class BossSpawn:
     """Boss spawn configuration."""
     
@@ -606,7 +612,7 @@ class BossSpawn:
     normalized_name: str  # Use boss.normalized_name instead
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class LootContainer:
     """Loot container information."""
     id: str
@@ -614,7 +620,7 @@ class LootContainer:
     normalized_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class MapExtract:
     """Map extraction point."""
     id: str
@@ -629,7 +635,7 @@ class MapExtract:
     right: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class MapHazard:
     """Map hazard information."""
     name: str
@@ -642,14 +648,14 @@ class MapHazard:
     right: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class MapLoot:
     """Map loot spawn information."""
     item: Item
     positions: Optional[List[Dict[str, float]]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class MapSpawn:
     """Map spawn point."""
     position: Dict[str, float]
@@ -658,7 +664,7 @@ class MapSpawn:
     zoneName: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class Map:
     """Game map information."""
     id: str
@@ -686,7 +692,7 @@ class Map:
 
 # Deprecated types - kept for backwards compatibility
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class HideoutModule:
     """Deprecated - replaced with HideoutStation."""
     
@@ -697,7 +703,7 @@ class HideoutModule:
     module_requirements: List['HideoutModule']
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class HideoutStationLevel:
     """Hideout station level information."""
     level: int
@@ -711,7 +717,7 @@ class HideoutStationLevel:
     bonuses: Optional[List[Dict[str, Any]]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class HideoutStation:
     """Hideout station/module information."""
     id: str
@@ -722,7 +728,7 @@ class HideoutStation:
     tarkov_data_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class QuestRewardReputation:
     """Deprecated - part of old Quest system."""
     
@@ -730,7 +736,7 @@ class QuestRewardReputation:
     amount: float
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class QuestObjective:
     """Deprecated - replaced with TaskObjective."""
     
@@ -742,7 +748,7 @@ class QuestObjective:
     location: Optional[str]
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class QuestRequirement:
     """Deprecated - replaced with TaskRequirement."""
     
@@ -751,7 +757,7 @@ class QuestRequirement:
     prerequisite_quests: List[List['Quest']]
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class Quest:
     """Deprecated - replaced with Task."""
     
@@ -767,7 +773,7 @@ class Quest:
     objectives: List[QuestObjective]
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class TraderPrice:
     """Deprecated - replaced with ItemPrice."""
     
@@ -777,7 +783,7 @@ class TraderPrice:
     trader: Trader
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class TraderResetTime:
     """Deprecated - replaced with Trader."""
     
@@ -785,7 +791,7 @@ class TraderResetTime:
     reset_timestamp: Optional[str]  # Use Trader.reset_time instead
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class ItemPrice:
     """Current item pricing information."""
     vendor: Optional[Trader]
@@ -795,7 +801,7 @@ class ItemPrice:
     updated: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class FleaMarket:
     """Flea market listing information."""
     item: Item
@@ -810,7 +816,7 @@ class FleaMarket:
     trader_price_rub: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class Status:
     """API status information."""
     name: str
@@ -819,21 +825,21 @@ class Status:
     status_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class PlayerLevel:
     """Player level information."""
     level: int
     exp: int
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class SkillLevel:
     """Skill level information."""
     name: str
     level: float
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class HistoricalPricePoint:
     """Historical price data point."""
     price: Optional[int] = None
@@ -841,7 +847,7 @@ class HistoricalPricePoint:
     timestamp: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class Lock:
     """Lock information."""
     id: str
@@ -858,7 +864,7 @@ class Lock:
     right: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class Mastering:
     """Weapon mastering information."""
     id: str
@@ -867,7 +873,7 @@ class Mastering:
     level3: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class QuestItem:
     """Quest-specific items with enhanced metadata."""
     id: str
@@ -888,7 +894,7 @@ class QuestItem:
     received_from_tasks: Optional[List[Task]] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class GoonReport:
     """Community-driven goon squad sighting report."""
     id: str
@@ -899,7 +905,7 @@ class GoonReport:
     verified: Optional[bool] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class HealthEffect:
     """Health effect information for medical items."""
     type: str
@@ -908,14 +914,14 @@ class HealthEffect:
     delay: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class HealthPart:
     """Body part health information."""
     body_parts: List[str]
     effects: List[HealthEffect]
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class StimEffect:
     """Stimulant effect information."""
     type: str
@@ -927,7 +933,7 @@ class StimEffect:
     skill_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class ItemCategory:
     """Enhanced item category with proper object structure."""
     id: str
@@ -936,7 +942,7 @@ class ItemCategory:
     parent: Optional['ItemCategory'] = None
 
 
-@dataclass
+@dataclass(**_DC_KWARGS)
 class HandbookCategory:
     """In-game handbook category."""
     id: str
@@ -947,48 +953,62 @@ class HandbookCategory:
 
 # Helper functions for MCP server development
 
+# Known values map straight to their interned normalized form; anything else falls back to lower()
+_NORMALIZED_SIDES = {side.value: sys.intern(side.value.lower()) for side in Side}
+_NORMALIZED_SIDES[""] = ""
+_NORMALIZED_RARITIES = {rarity.value: sys.intern(rarity.value.lower()) for rarity in Rarity}
+_NORMALIZED_RARITIES[""] = ""
+
+
 def normalize_side(side: str) -> str:
     """Convert side to lowercase normalized format."""
-    return side.lower() if side else ""
+    normalized = _NORMALIZED_SIDES.get(side)
+    if normalized is None:
+        normalized = side.lower() if side else ""
+    return normalized
 
 
 def normalize_rarity(rarity: str) -> str:
     """Convert rarity to lowercase normalized format."""
-    return rarity.lower() if rarity else ""
+    normalized = _NORMALIZED_RARITIES.get(rarity)
+    if normalized is None:
+        normalized = rarity.lower() if rarity else ""
+    return normalized
+
+
+_DEPRECATED_FIELDS = frozenset({
+    'accuracy', 'recoil', 'source', 'sourceName', 'requirements',
+    'name', 'normalizedName', 'description'
+})
 
 
 def is_deprecated_field(field_name: str) -> bool:
     """Check if a field is marked as deprecated."""
-    deprecated_fields = {
-        'accuracy', 'recoil', 'source', 'sourceName', 'requirements',
-        'name', 'normalizedName', 'description'
-    }
-    return field_name in deprecated_fields
+    return field_name in _DEPRECATED_FIELDS
+
+
+def _intern(value: Any) -> Any:
+    """Intern a low-cardinality string field so repeated rows share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _names_from_api(values: Optional[list]) -> List[str]:
+    """Extract names from a list of API objects, keeping bare values as strings."""
+    return [_intern(value.get('name', 'Unknown')) if isinstance(value, dict) else str(value) for value in values or ()]
 
 
 def parse_task_objective_from_api(data: dict) -> TaskObjective:
     """Parse TaskObjective from API response data."""
-    # Extract map names from map objects
-    maps = []
-    if data.get('maps'):
-        for map_data in data.get('maps', []):
-            if isinstance(map_data, dict):
-                maps.append(map_data.get('name', 'Unknown'))
-            else:
-                maps.append(str(map_data))
+    # Map and target objects are reduced to their names
+    maps = _names_from_api(data.get('maps'))
+    target = _names_from_api(data.get('target'))
     
-    # Extract target names from target objects
-    target = []
-    if data.get('target'):
-        for target_data in data.get('target', []):
-            if isinstance(target_data, dict):
-                target.append(target_data.get('name', 'Unknown'))
-            else:
-                target.append(str(target_data))
+    target_item_data = data.get('targetItem')
+    target_item = parse_item_from_api(target_item_data) if target_item_data else None
     
     return TaskObjective(
         id=data.get('id', ''),
-        type_=data.get('type', ''),
+        type_=_intern(data.get('type', '')),
         description=data.get('description', ''),
         maps=maps,
         optional=data.get('optional'),
@@ -998,7 +1018,7 @@ def parse_task_objective_from_api(data: dict) -> TaskObjective:
         player_level_min=data.get('playerLevelMin'),
         player_level_max=data.get('playerLevelMax'),
         target=target,
-        target_item=parse_item_from_api(data.get('targetItem', {})) if data.get('targetItem') else None,
+        target_item=target_item,
         zones=data.get('zones', [])
     )
 
@@ -1016,13 +1036,8 @@ def parse_task_requirement_from_api(data: dict) -> TaskRequirement:
 
 def parse_task_rewards_from_api(data: dict) -> TaskRewards:
     """Parse TaskRewards from API response data."""
-    items = []
-    if data.get('items'):
-        items = [parse_contained_item_from_api(item_data) for item_data in data.get('items', [])]
-    
-    trader_unlock = []
-    if data.get('traderUnlock'):
-        trader_unlock = [parse_trader_from_api(trader_data) for trader_data in data.get('traderUnlock', [])]
+    items = [parse_contained_item_from_api(item_data) for item_data in data.get('items') or []]
+    trader_unlock = [parse_trader_from_api(trader_data) for trader_data in data.get('traderUnlock') or []]
     
     return TaskRewards(
         experience=data.get('experience'),
@@ -1035,30 +1050,48 @@ def parse_task_rewards_from_api(data: dict) -> TaskRewards:
     )
 
 
-def parse_item_price_from_api(data: dict) -> ItemPrice:
-    """Parse ItemPrice from API response data."""
-    # Create a minimal vendor object to avoid circular dependencies
+# The vendor fields _parse_vendor_from_api reads, used to share one Trader per distinct vendor
+_VENDOR_KEY_FIELDS = ('id', 'name', 'normalizedName', 'description', 'wikiLink', 'imageLink', 'resetTime', 'discount')
+
+
+def _parse_vendor_from_api(vendor_data: dict) -> Trader:
+    """Parse a minimal vendor Trader, skipping levels and currencies to avoid circular dependencies."""
+    return Trader(
+        id=vendor_data.get('id', ''),
+        name=vendor_data.get('name', ''),
+        normalized_name=vendor_data.get('normalizedName'),
+        description=vendor_data.get('description'),
+        wiki_link=vendor_data.get('wikiLink'),
+        image_link=vendor_data.get('imageLink'),
+        levels=None,
+        currency=None,
+        reset_time=vendor_data.get('resetTime'),
+        discount=vendor_data.get('discount'),
+        repair_currency=None
+    )
+
+
+def parse_item_price_from_api(data: dict, vendors: Optional[Dict[tuple, Trader]] = None) -> ItemPrice:
+    """Parse ItemPrice from API response data, reusing vendors already parsed into `vendors`."""
     vendor = None
-    if data.get('vendor'):
-        vendor_data = data.get('vendor', {})
-        vendor = Trader(
-            id=vendor_data.get('id', ''),
-            name=vendor_data.get('name', ''),
-            normalized_name=vendor_data.get('normalizedName'),
-            description=vendor_data.get('description'),
-            wiki_link=vendor_data.get('wikiLink'),
-            image_link=vendor_data.get('imageLink'),
-            levels=None,  # Don't parse levels to avoid circular dependencies
-            currency=None,
-            reset_time=vendor_data.get('resetTime'),
-            discount=vendor_data.get('discount'),
-            repair_currency=None
-        )
+    vendor_data = data.get('vendor')
+    if vendor_data:
+        if vendors is None:
+            vendor = _parse_vendor_from_api(vendor_data)
+        else:
+            # Key on exactly the fields the vendor Trader is built from; other nested fields don't matter
+            key = tuple(vendor_data.get(field) for field in _VENDOR_KEY_FIELDS)
+            try:
+                vendor = vendors.get(key)
+                if vendor is None:
+                    vendor = vendors[key] = _parse_vendor_from_api(vendor_data)
+            except TypeError:  # an unhashable value in a keyed field; parse without sharing
+                vendor = _parse_vendor_from_api(vendor_data)
     
     return ItemPrice(
         vendor=vendor,
         price=data.get('price', 0),
-        currency=data.get('currency', 'RUB'),
+        currency=_intern(data.get('currency', 'RUB')),
         price_rub=data.get('priceRUB', data.get('price', 0)),
         updated=data.get('updated')
     )
@@ -1082,9 +1115,8 @@ def parse_trader_level_from_api(data: dict) -> TraderLevel:
 
 def parse_contained_item_from_api(data: dict) -> ContainedItem:
     """Parse ContainedItem from API response data."""
-    item = None
-    if data.get('item'):
-        item = parse_item_from_api(data.get('item', {}))
+    item_data = data.get('item')
+    item = parse_item_from_api(item_data) if item_data else None
     
     return ContainedItem(
         item=item,
@@ -1094,7 +1126,7 @@ def parse_contained_item_from_api(data: dict) -> ContainedItem:
     )
 
 
-def parse_item_from_api(data: dict) -> Item:
+def parse_item_from_api(data: dict, vendors: Optional[Dict[tuple, Trader]] = None) -> Item:
     """Parse Item from API response data."""
     return Item(
         id=data.get('id', ''),
@@ -1115,8 +1147,8 @@ def parse_item_from_api(data: dict) -> Item:
         image_link=data.get('imageLink'),
         grid_image_link=data.get('gridImageLink'),
         base_image_link=data.get('baseImageLink'),
-        types=data.get('types', []),
-        category=data.get('category'),
+        types=[_intern(item_type) for item_type in data.get('types') or ()],
+        category=_intern(data.get('category')),
         # Additional comprehensive fields
         normalized_name=data.get('normalizedName'),
         background_color=data.get('backgroundColor'),
@@ -1131,8 +1163,8 @@ def parse_item_from_api(data: dict) -> Item:
         has_grid=data.get('hasGrid'),
         blocks_headphones=data.get('blocksHeadphones'),
         link=data.get('link'),
-        sell_for=[parse_item_price_from_api(price) for price in data.get('sellFor', [])],
-        buy_for=[parse_item_price_from_api(price) for price in data.get('buyFor', [])],
+        sell_for=[parse_item_price_from_api(price, vendors) for price in data.get('sellFor') or ()],
+        buy_for=[parse_item_price_from_api(price, vendors) for price in data.get('buyFor') or ()],
         used_in_tasks=data.get('usedInTasks', []),  # Keep as raw data to avoid circular deps
         received_from_tasks=data.get('receivedFromTasks', []),  # Keep as raw data to avoid circular deps
         barters_for=data.get('bartersFor', []),  # Keep as raw data to avoid circular deps
@@ -1143,22 +1175,28 @@ def parse_item_from_api(data: dict) -> Item:
     )
 
 
+def parse_items_from_api(rows: List[dict]) -> List[Item]:
+    """Parse a list of items, sharing one Trader object per distinct price vendor."""
+    vendors: Dict[tuple, Trader] = {}
+    return [parse_item_from_api(row, vendors) for row in rows]
+
+
 def parse_trader_from_api(data: dict) -> Trader:
     """Parse Trader from API response data."""
-    currency_data = data.get('currency', {})
+    currency_data = data.get('currency')
     currency = parse_item_from_api(currency_data) if currency_data else None
     
-    repair_currency_data = data.get('repairCurrency', {})
+    repair_currency_data = data.get('repairCurrency')
     repair_currency = parse_item_from_api(repair_currency_data) if repair_currency_data else None
     
     return Trader(
         id=data.get('id', ''),
-        name=data.get('name', ''),
-        normalized_name=data.get('normalizedName'),
+        name=_intern(data.get('name', '')),
+        normalized_name=_intern(data.get('normalizedName')),
         description=data.get('description'),
         wiki_link=data.get('wikiLink'),
         image_link=data.get('imageLink'),
-        levels=[parse_trader_level_from_api(level) for level in data.get('levels', [])],
+        levels=[parse_trader_level_from_api(level) for level in data.get('levels') or ()],
         currency=currency,
         reset_time=data.get('resetTime'),
         discount=data.get('discount'),
@@ -1169,12 +1207,18 @@ def parse_trader_from_api(data: dict) -> Trader:
 
 def parse_task_from_api(data: dict) -> Task:
     """Parse Task from API response data."""
-    trader_data = data.get('trader', {})
+    trader_data = data.get('trader')
     trader = parse_trader_from_api(trader_data) if trader_data else None
     
-    map_data = data.get('map', {})
+    map_data = data.get('map')
     map_obj = parse_map_from_api(map_data) if map_data else None
     
+    start_rewards_data = data.get('startRewards')
+    start_rewards = parse_task_rewards_from_api(start_rewards_data) if start_rewards_data else None
+    
+    finish_rewards_data = data.get('finishRewards')
+    finish_rewards = parse_task_rewards_from_api(finish_rewards_data) if finish_rewards_data else None
+    
     return Task(
         id=data.get('id', ''),
         name=data.get('name', ''),
@@ -1183,11 +1227,11 @@ def parse_task_from_api(data: dict) -> Task:
         experience=data.get('experience'),
         wiki_link=data.get('wikiLink'),
         min_player_level=data.get('minPlayerLevel'),
-        objectives=[parse_task_objective_from_api(obj) for obj in data.get('objectives', [])],
-        start_rewards=parse_task_rewards_from_api(data.get('startRewards', {})) if data.get('startRewards') else None,
-        finish_rewards=parse_task_rewards_from_api(data.get('finishRewards', {})) if data.get('finishRewards') else None,
+        objectives=[parse_task_objective_from_api(obj) for obj in data.get('objectives') or ()],
+        start_rewards=start_rewards,
+        finish_rewards=finish_rewards,
         fail_conditions=data.get('failConditions', []),
-        task_requirements=[parse_task_requirement_from_api(req) for req in data.get('taskRequirements', [])],
+        task_requirements=[parse_task_requirement_from_api(req) for req in data.get('taskRequirements') or ()],
         normalized_name=data.get('normalizedName'),
         fandom_link=data.get('fandomLink'),
         task_image_link=data.get('taskImageLink'),
@@ -1206,8 +1250,8 @@ def parse_map_from_api(data: dict) -> Map:
     """Parse Map from API response data."""
     return Map(
         id=data.get('id', ''),
-        name=data.get('name', ''),
-        normalized_name=data.get('normalizedName'),
+        name=_intern(data.get('name', '')),
+        normalized_name=_intern(data.get('normalizedName')),
         wiki=data.get('wiki'),
         description=data.get('description'),
         enemies=data.get('enemies', []),
@@ -1230,10 +1274,10 @@ def parse_map_from_api(data: dict) -> Map:
 
 def parse_barter_from_api(data: dict) -> Barter:
     """Parse Barter from API response data."""
-    trader_data = data.get('trader', {})
+    trader_data = data.get('trader')
     trader = parse_trader_from_api(trader_data) if trader_data else None
     
-    task_data = data.get('taskUnlock', {})
+    task_data = data.get('taskUnlock')
     task = parse_task_from_api(task_data) if task_data else None
     
     return Barter(
@@ -1253,7 +1297,7 @@ def parse_barter_from_api(data: dict) -> Barter:
 
 def parse_craft_from_api(data: dict) -> Craft:
     """Parse Craft from API response data."""
-    station_data = data.get('station', {})
+    station_data = data.get('station')
     station = HideoutStation(
         id=station_data.get('id', ''),
         name=station_data.get('name', ''),
@@ -1275,17 +1319,17 @@ def parse_craft_from_api(data: dict) -> Craft:
 
 def parse_ammo_from_api(data: dict) -> Ammo:
     """Parse Ammo from API response data."""
-    item_data = data.get('item', {})
+    item_data = data.get('item')
     item = parse_item_from_api(item_data) if item_data else Item(id='', name='')
     
     return Ammo(
         item=item,
         weight=data.get('weight', 0.0),
-        caliber=data.get('caliber'),
+        caliber=_intern(data.get('caliber')),
         stack_max_size=data.get('stackMaxSize', 1),
         tracer=data.get('tracer', False),
-        tracer_color=data.get('tracerColor'),
-        ammo_type=data.get('ammoType', ''),
+        tracer_color=_intern(data.get('tracerColor')),
+        ammo_type=_intern(data.get('ammoType', '')),
         projectile_count=data.get('projectileCount'),
         damage=data.get('damage', 0),
         armor_damage=data.get('armorDamage', 0),
@@ -2,12 +2,15 @@
 
 import asyncio
 import logging
-from typing import Any, Sequence
+from typing import Any, Dict, Optional, Sequence
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 import mcp.server.stdio
 import mcp.types as types
 
+from tarkov_mcp.graphql_client import close_connector, warm_cache
 from tarkov_mcp.tools.items import ItemTools
 from tarkov_mcp.tools.market import MarketTools
 from tarkov_mcp.tools.maps import MapTools
@@ -45,9 +48,51 @@ class TarkovMCPServer:
             self.community_tools.tools
         )
         
+        # Build the input validators once instead of re-checking each schema per call
+        self._validators: Dict[str, Any] = {
+            tool.name: validator_for(tool.inputSchema)(tool.inputSchema)
+            for tool in self.all_tools
+        }
+        
+        # Route tool names to their bound handlers with one dict lookup per call
+        self._handlers: Dict[str, Any] = {
+            "search_items": self.item_tools.handle_search_items,
+            "get_item_details": self.item_tools.handle_get_item_details,
+            "get_item_prices": self.item_tools.handle_get_item_prices,
+            "compare_items": self.item_tools.handle_compare_items,
+            "get_flea_market_data": self.market_tools.handle_get_flea_market_data,
+            "get_barter_trades": self.market_tools.handle_get_barter_trades,
+            "calculate_barter_profit": self.market_tools.handle_calculate_barter_profit,
+            "get_ammo_data": self.market_tools.handle_get_ammo_data,
+            "get_hideout_modules": self.market_tools.handle_get_hideout_modules,
+            "get_crafts": self.market_tools.handle_get_crafts,
+            "get_maps": self.map_tools.handle_get_maps,
+            "get_map_details": self.map_tools.handle_get_map_details,
+            "get_map_spawns": self.map_tools.handle_get_map_spawns,
+            "get_traders": self.trader_tools.handle_get_traders,
+            "get_trader_details": self.trader_tools.handle_get_trader_details,
+            "get_trader_items": self.trader_tools.handle_get_trader_items,
+            "get_quests": self.quest_tools.handle_get_quests,
+            "get_quest_details": self.quest_tools.handle_get_quest_details,
+            "search_quests": self.quest_tools.handle_search_quests,
+            "get_quest_items": self.item_tools.handle_get_quest_items,
+            "get_goon_reports": self.community_tools.handle_get_goon_reports,
+        }
+        
         # Register handlers
         self._register_handlers()
     
+    def _validate_arguments(self, name: str, arguments: Dict[str, Any]) -> Optional[str]:
+        """Validate tool arguments against the tool's input schema, returning an error message if invalid."""
+        validator = self._validators.get(name)
+        if validator is None:
+            return None
+        try:
+            validator.validate(arguments)
+        except ValidationError as e:
+            return f"Input validation error: {e.message}"
+        return None
+    
     def _register_handlers(self):
         """Register all MCP handlers."""
         
@@ -56,62 +101,26 @@ class TarkovMCPServer:
             """List available tools."""
             return self.all_tools
         
-        @self.server.call_tool()
+        @self.server.call_tool(validate_input=False)
         async def handle_call_tool(name: str, arguments: dict[str, Any]) -> Sequence[types.TextContent | types.ImageContent | types.EmbeddedResource]:
             """Handle tool calls."""
-            logger.info(f"Tool called: {name} with arguments: {arguments}")
+            logger.info("Tool called: %s with arguments: %s", name, arguments)
+            
+            validation_error = self._validate_arguments(name, arguments)
+            if validation_error:
+                # Raised so the SDK wraps it as an isError=True result, as its own validation would
+                raise ValueError(validation_error)
             
             try:
-                # Route to appropriate tool handler
-                if name == "search_items":
-                    return await self.item_tools.handle_search_items(arguments)
-                elif name == "get_item_details":
-                    return await self.item_tools.handle_get_item_details(arguments)
-                elif name == "get_item_prices":
-                    return await self.item_tools.handle_get_item_prices(arguments)
-                elif name == "compare_items":
-                    return await self.item_tools.handle_compare_items(arguments)
-                elif name == "get_flea_market_data":
-                    return await self.market_tools.handle_get_flea_market_data(arguments)
-                elif name == "get_barter_trades":
-                    return await self.market_tools.handle_get_barter_trades(arguments)
-                elif name == "calculate_barter_profit":
-                    return await self.market_tools.handle_calculate_barter_profit(arguments)
-                elif name == "get_ammo_data":
-                    return await self.market_tools.handle_get_ammo_data(arguments)
-                elif name == "get_hideout_modules":
-                    return await self.market_tools.handle_get_hideout_modules(arguments)
-                elif name == "get_crafts":
-                    return await self.market_tools.handle_get_crafts(arguments)
-                elif name == "get_maps":
-                    return await self.map_tools.handle_get_maps(arguments)
-                elif name == "get_map_details":
-                    return await self.map_tools.handle_get_map_details(arguments)
-                elif name == "get_map_spawns":
-                    return await self.map_tools.handle_get_map_spawns(arguments)
-                elif name == "get_traders":
-                    return await self.trader_tools.handle_get_traders(arguments)
-                elif name == "get_trader_details":
-                    return await self.trader_tools.handle_get_trader_details(arguments)
-                elif name == "get_trader_items":
-                    return await self.trader_tools.handle_get_trader_items(arguments)
-                elif name == "get_quests":
-                    return await self.quest_tools.handle_get_quests(arguments)
-                elif name == "get_quest_details":
-                    return await self.quest_tools.handle_get_quest_details(arguments)
-                elif name == "search_quests":
-                    return await self.quest_tools.handle_search_quests(arguments)
-                elif name == "get_quest_items":
-                    return await self.item_tools.handle_get_quest_items(arguments)
-                elif name == "get_goon_reports":
-                    return await self.community_tools.handle_get_goon_reports(arguments)
-                else:
+                handler = self._handlers.get(name)
+                if handler is None:
                     return [TextContent(
                         type="text",
                         text=f"Unknown tool: {name}"
                     )]
+                return await handler(arguments)
             except Exception as e:
-                logger.error(f"Error handling tool {name}: {e}")
+                logger.error("Error handling tool %s: %s", name, e)
                 return [TextContent(
                     type="text",
                     text=f"Error executing tool {name}: {str(e)}"
@@ -121,13 +130,21 @@ class TarkovMCPServer:
         """Run the MCP server."""
         logger.info("Starting Tarkov MCP Server...")
         
+        # Prefetch reference data in the background so the first tool call hits the cache
+        warm_task = asyncio.create_task(warm_cache()) if config.WARM_CACHE else None
+        
         # Run the server using stdio transport
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        try:
+            async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+        finally:
+            if warm_task:
+                warm_task.cancel()
+            await close_connector()
 
 async def main():
     """Main entry point."""
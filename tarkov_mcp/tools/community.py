@@ -45,31 +45,34 @@ class CommunityTools:
                     text="No goon squad reports found"
                 )]
             
-            result_text = f"# Recent Goon Squad Reports ({len(goon_reports_data)} reports)\n\n"
+            parts = [f"# Recent Goon Squad Reports ({len(goon_reports_data)} reports)\n\n"]
             
             for report in goon_reports_data:
                 map_name = report.get('map', {}).get('name', 'Unknown Map')
                 timestamp = report.get('timestamp', 'Unknown time')
                 location = report.get('location', 'Unknown location')
                 spotted_by = report.get('spottedBy', 'Anonymous')
-                verified = report.get('verified', False)
                 
-                status_emoji = "✅" if verified else "⚠️"
-                verification_status = "Verified" if verified else "Unverified"
+                status_emoji, verification_status = ("✅", "Verified") if report.get('verified', False) else ("⚠️", "Unverified")
                 
-                result_text += f"## {status_emoji} {map_name} - {location}\n"
-                result_text += f"**Time:** {timestamp}\n"
-                result_text += f"**Reported by:** {spotted_by}\n"
-                result_text += f"**Status:** {verification_status}\n\n"
-                result_text += "---\n\n"
+                parts.append(
+                    f"## {status_emoji} {map_name} - {location}\n"
+                    f"**Time:** {timestamp}\n"
+                    f"**Reported by:** {spotted_by}\n"
+                    f"**Status:** {verification_status}\n\n"
+                    "---\n\n"
+                )
             
-            result_text += "\n💡 **Note:** Goon squads are roaming boss groups that can appear on various maps. "
-            result_text += "These reports are community-driven and may not be 100% accurate. Always be cautious when entering areas with recent sightings.\n"
+            parts.append(
+                "\n💡 **Note:** Goon squads are roaming boss groups that can appear on various maps. "
+                "These reports are community-driven and may not be 100% accurate. Always be cautious when entering areas with recent sightings.\n"
+            )
+            result_text = "".join(parts)
             
             return [TextContent(type="text", text=result_text)]
             
         except Exception as e:
-            logger.error(f"Error getting goon reports: {e}")
+            logger.error("Error getting goon reports: %s", e)
             return [TextContent(
                 type="text",
                 text=f"Error getting goon reports: {str(e)}"
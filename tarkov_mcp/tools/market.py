@@ -5,7 +5,7 @@ from mcp.types import Tool, TextContent
 import logging
 
 from tarkov_mcp.graphql_client import TarkovGraphQLClient
-from tarkov_mcp.schema import parse_item_from_api
+from tarkov_mcp.schema import parse_items_from_api
 
 logger = logging.getLogger(__name__)
 
@@ -116,7 +116,8 @@ class MarketTools:
         
         try:
             async with TarkovGraphQLClient() as client:
-                items_data = await client.get_flea_market_data(limit=limit)
+                # Only the 24h price fields are rendered, so skip the vendor price lists
+                items_data = await client.get_flea_market_data(limit=limit, fields=())
             
             if not items_data:
                 return [TextContent(
@@ -125,7 +126,7 @@ class MarketTools:
                 )]
             
             # Parse items using schema
-            items = [parse_item_from_api(item_data) for item_data in items_data]
+            items = parse_items_from_api(items_data)
             
             # Sort by 24h average price (highest first)
             items_with_prices = [item for item in items if item.avg24h_price]
@@ -414,7 +415,7 @@ class MarketTools:
         """Handle get_hideout_modules tool call."""
         try:
             async with TarkovGraphQLClient() as client:
-                modules = await client.get_hideout_modules()
+                modules = await client.get_hideout_modules(fields=("requirements", "crafts"))
             
             if not modules:
                 return [TextContent(
@@ -119,7 +119,7 @@ class QuestTools:
             return [TextContent(type="text", text=result_text)]
             
         except Exception as e:
-            logger.error(f"Error getting quests: {e}")
+            logger.exception("Error getting quests: %s", e)
             return [TextContent(
                 type="text",
                 text=f"Error getting quests: {str(e)}"
@@ -245,7 +245,7 @@ class QuestTools:
             return [TextContent(type="text", text=result_text)]
             
         except Exception as e:
-            logger.error(f"Error getting quest details: {e}")
+            logger.exception("Error getting quest details: %s", e)
             return [TextContent(
                 type="text",
                 text=f"Error getting quest details: {str(e)}"
@@ -302,7 +302,7 @@ class QuestTools:
             return [TextContent(type="text", text=result_text)]
             
         except Exception as e:
-            logger.error(f"Error searching quests: {e}")
+            logger.exception("Error searching quests: %s", e)
             return [TextContent(
                 type="text",
                 text=f"Error searching quests: {str(e)}"
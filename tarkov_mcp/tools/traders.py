@@ -100,7 +100,7 @@ class TraderTools:
             return [TextContent(type="text", text=result_text)]
             
         except Exception as e:
-            logger.error(f"Error getting traders: {e}")
+            logger.exception("Error getting traders: %s", e)
             return [TextContent(
                 type="text",
                 text=f"Error getting traders: {str(e)}"
@@ -192,7 +192,7 @@ class TraderTools:
             return [TextContent(type="text", text=result_text)]
             
         except Exception as e:
-            logger.error(f"Error getting trader details: {e}")
+            logger.exception("Error getting trader details: %s", e)
             return [TextContent(
                 type="text",
                 text=f"Error getting trader details: {str(e)}"
@@ -274,7 +274,7 @@ class TraderTools:
             return [TextContent(type="text", text=result_text)]
             
         except Exception as e:
-            logger.error(f"Error getting trader items: {e}")
+            logger.exception("Error getting trader items: %s", e)
             return [TextContent(
                 type="text",
                 text=f"Error getting trader items: {str(e)}"
@@ -0,0 +1,599 @@
+"""Tests for GraphQL client caching, batching, request shaping and connection handling."""
+
+import pytest
+import asyncio
+import gc
+import hashlib
+import json
+import warnings
+from unittest.mock import AsyncMock, patch
+from gql.transport.exceptions import TransportServerError
+from graphql import print_ast
+from tarkov_mcp.config import config
+from tarkov_mcp.graphql_client import TarkovGraphQLClient, RateLimiter, QueryBatcher, TTLCache, close_connector, get_cache, get_connector, get_request_semaphore, warm_cache
+
+# Set timeout for all async tests to prevent hanging
+pytestmark = pytest.mark.timeout(30)
+
+@pytest.fixture(autouse=True)
+def clear_query_cache():
+    """Start every test with an empty query cache."""
+    get_cache().clear()
+    yield
+    get_cache().clear()
+
+class TestRateLimiter:
+    """Test rate limiter sharing and concurrency."""
+    
+    @pytest.mark.asyncio
+    async def test_rate_limiter_concurrent_waiters(self):
+        """Test that concurrent callers waiting on the limiter all get through."""
+        limiter = RateLimiter(max_requests=2, time_window=0.2)
+        
+        await asyncio.wait_for(asyncio.gather(*(limiter.acquire() for _ in range(5))), timeout=5)
+        assert limiter._tokens < 1
+    
+    def test_rate_limiter_lock_follows_event_loop(self):
+        """Test that a contended limiter keeps working after the event loop changes."""
+        limiter = RateLimiter(max_requests=5, time_window=60)
+        
+        async def contended():
+            async with limiter._get_lock():
+                waiter = asyncio.create_task(limiter.acquire())
+                await asyncio.sleep(0)
+            await waiter
+        
+        asyncio.run(contended())
+        asyncio.run(contended())
+        assert limiter._tokens < 4
+    
+    def test_rate_limiter_shared_between_clients(self):
+        """Test that all clients draw from the same rate limiter."""
+        assert TarkovGraphQLClient().rate_limiter is TarkovGraphQLClient().rate_limiter
+
+class TestTarkovGraphQLClient:
+    """Test GraphQL client caching, batching and request handling."""
+    
+    @pytest.fixture
+    def mock_client_response(self):
+        """Mock GraphQL client response."""
+        return {
+            "items": [
+                {
+                    "id": "test-id-1",
+                    "name": "Test Item",
+                    "shortName": "TI",
+                    "avg24hPrice": 10000,
+                    "types": ["weapon"]
+                }
+            ]
+        }
+    
+    @pytest.mark.asyncio
+    async def test_search_items_selects_requested_fields(self, mock_client_response):
+        """Test that search_items only requests the field sections asked for."""
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.execute_async.return_value = mock_client_response
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                await client.search_items(name="Test", fields=["prices"])
+                with pytest.raises(ValueError):
+                    await client.search_items(name="Test", fields=["bogus"])
+        
+        request = mock_client.execute_async.call_args.args[0]
+        query = print_ast(getattr(request, "document", request))
+        assert "avg24hPrice" in query
+        assert "properties" not in query
+        assert "sellFor" not in query
+    
+    @pytest.mark.asyncio
+    async def test_search_items_batch_uses_one_request(self):
+        """Test that search_items_batch aliases one lookup per name and keeps input order."""
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.execute_async.return_value = {
+                "item0": [{"id": "a", "name": "Salewa"}],
+                "item1": [],
+            }
+            mock_client_class.return_value = mock_client
+
+            async with TarkovGraphQLClient() as client:
+                results = await client.search_items_batch(["Salewa", "Nothing"], fields=["prices"])
+
+        assert results == [{"id": "a", "name": "Salewa"}, None]
+        mock_client.execute_async.assert_awaited_once()
+        call = mock_client.execute_async.call_args
+        query = print_ast(getattr(call.args[0], "document", call.args[0]))
+        assert "item1: items(name: $name1, limit: 1, lang: $lang)" in query
+        assert call.kwargs["variable_values"] == {"lang": "en", "name0": "Salewa", "name1": "Nothing"}
+    
+    @pytest.mark.asyncio
+    async def test_get_items_by_ids_keeps_input_order(self):
+        """Test that get_items_by_ids makes one cached request and returns items in input order."""
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.execute_async.return_value = {"items": [{"id": "b"}, {"id": "a"}]}
+            mock_client_class.return_value = mock_client
+
+            async with TarkovGraphQLClient() as client:
+                first = await client.get_items_by_ids(["a", "missing", "b"], fields=["details"])
+                second = await client.get_items_by_ids(["a", "missing", "b"], fields=["details"])
+
+        assert first == second == [{"id": "a"}, {"id": "b"}]
+        mock_client.execute_async.assert_awaited_once()
+        request = mock_client.execute_async.call_args.args[0]
+        query = print_ast(getattr(request, "document", request))
+        assert "items(ids: $ids, lang: $lang)" in query
+        assert "basePrice" in query
+        assert "sellFor" not in query
+    
+    @pytest.mark.asyncio
+    async def test_get_hideout_modules_selects_requested_fields(self):
+        """Test that get_hideout_modules only requests the level sections asked for."""
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.execute_async.return_value = {"hideoutStations": []}
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                await client.get_hideout_modules(fields=["crafts"])
+                with pytest.raises(ValueError):
+                    await client.get_hideout_modules(fields=["bogus"])
+        
+        request = mock_client.execute_async.call_args.args[0]
+        query = print_ast(getattr(request, "document", request))
+        assert "crafts" in query
+        assert "itemRequirements" not in query
+        assert "bonuses" not in query
+    
+    @pytest.mark.asyncio
+    async def test_get_flea_market_data_selects_requested_fields(self):
+        """Test that get_flea_market_data only requests the sections asked for."""
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.execute_async.return_value = {"items": []}
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                await client.get_flea_market_data(limit=10, fields=())
+                with pytest.raises(ValueError):
+                    await client.get_flea_market_data(fields=["bogus"])
+        
+        request = mock_client.execute_async.call_args.args[0]
+        query = print_ast(getattr(request, "document", request))
+        assert "avg24hPrice" in query
+        assert "sellFor" not in query
+    
+    @pytest.mark.asyncio
+    async def test_get_trader_items_always_sends_trader(self):
+        """Test that the non-null trader variable is sent even when empty, and an unset level is dropped."""
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.execute_async.return_value = {"traders": []}
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                await client.get_trader_items("")
+        
+        assert mock_client.execute_async.call_args.kwargs["variable_values"] == {"trader": ""}
+    
+    @pytest.mark.asyncio
+    async def test_search_items_iter_pages_with_offset(self):
+        """Test that search_items_iter walks pages by offset and stops at the limit."""
+        pages = [
+            {"items": [{"id": "a"}, {"id": "b"}]},
+            {"items": [{"id": "c"}, {"id": "d"}]},
+            {"items": [{"id": "e"}]},
+        ]
+        
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.execute_async.side_effect = pages
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                seen = [page async for page in client.search_items_iter(name="Test", limit=5, page_size=2)]
+        
+        assert [[item["id"] for item in page] for page in seen] == [["a", "b"], ["c", "d"], ["e"]]
+        offsets = [call.kwargs["variable_values"]["offset"] for call in mock_client.execute_async.call_args_list]
+        assert offsets == [0, 2, 4]
+        assert mock_client.execute_async.call_args.kwargs["variable_values"]["limit"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_connector_shared_between_clients(self):
+        """Test that clients reuse one TCP connector and leave it open on exit."""
+        with patch('tarkov_mcp.graphql_client.SharedAIOHTTPTransport') as mock_transport_class, \
+             patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client_class.return_value = AsyncMock()
+            async with TarkovGraphQLClient():
+                pass
+            async with TarkovGraphQLClient():
+                pass
+
+        first, second = mock_transport_class.call_args_list
+        connector = first.kwargs["client_session_args"]["connector"]
+        assert second.kwargs["client_session_args"]["connector"] is connector
+        assert not connector.closed
+
+        await close_connector()
+        assert connector.closed
+    
+    @pytest.mark.asyncio
+    async def test_transport_closes_its_session(self):
+        """Test that closing the transport releases its session without leaking it or closing the shared connector."""
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            async with TarkovGraphQLClient() as client:
+                transport = client._client.transport
+                await transport.connect()
+                session = transport.session
+                await transport.close()
+            
+            assert session.closed
+            assert not get_connector().closed
+            del session, transport
+            gc.collect()
+        
+        assert not [w for w in caught if "Unclosed client session" in str(w.message)]
+        await close_connector()
+    
+    @pytest.mark.asyncio
+    async def test_transport_serializes_requests_to_str(self):
+        """Test that the transport's request serializer returns the str aiohttp expects."""
+        with patch('tarkov_mcp.graphql_client.SharedAIOHTTPTransport') as mock_transport_class, \
+             patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client_class.return_value = AsyncMock()
+            async with TarkovGraphQLClient():
+                pass
+
+        serialize = mock_transport_class.call_args.kwargs["json_serialize"]
+        payload = {"query": "{ items { id } }", "variables": {"name": "Ledx"}}
+        assert json.loads(serialize(payload)) == payload
+    
+    @pytest.mark.asyncio
+    async def test_batched_queries_share_one_request(self):
+        """Test that concurrent queries are sent as one batch and split by index."""
+        batcher = QueryBatcher(interval=0.01, max_size=10)
+        responses = [{"data": {"item": {"id": f"id-{i}"}}} for i in range(3)]
+        
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class, \
+             patch('tarkov_mcp.graphql_client._batcher', batcher), \
+             patch.object(config, 'BATCH_QUERIES', True), \
+             patch.object(QueryBatcher, '_post', AsyncMock(return_value=responses)) as mock_post:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                results = await asyncio.gather(*(client.get_item_by_id(f"id-{i}") for i in range(3)))
+        
+        assert [r["id"] for r in results] == ["id-0", "id-1", "id-2"]
+        mock_post.assert_awaited_once()
+        assert len(mock_post.call_args.args[0]) == 3
+        mock_client.execute_async.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_batching_falls_back_when_rejected(self):
+        """Test that a rejected batch disables batching and retries queries singly."""
+        batcher = QueryBatcher(interval=0.01, max_size=10)
+        
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class, \
+             patch('tarkov_mcp.graphql_client._batcher', batcher), \
+             patch.object(config, 'BATCH_QUERIES', True), \
+             patch.object(QueryBatcher, '_post', AsyncMock(return_value={"errors": ["batching unsupported"]})):
+            mock_client = AsyncMock()
+            mock_client.execute_async.return_value = {"item": {"id": "test-id"}}
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                result = await client.get_item_by_id("test-id")
+        
+        assert result["id"] == "test-id"
+        assert batcher.enabled is False
+        mock_client.execute_async.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_batching_survives_transient_errors(self):
+        """Test that a failed batch request falls back for that batch only."""
+        batcher = QueryBatcher(interval=0.01, max_size=10)
+        
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class, \
+             patch('tarkov_mcp.graphql_client._batcher', batcher), \
+             patch.object(config, 'BATCH_QUERIES', True), \
+             patch.object(QueryBatcher, '_post', AsyncMock(side_effect=TransportServerError("503 Service Unavailable", 503))):
+            mock_client = AsyncMock()
+            mock_client.execute_async.return_value = {"item": {"id": "test-id"}}
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                result = await client.get_item_by_id("test-id")
+        
+        assert result["id"] == "test-id"
+        assert batcher.enabled is True
+        mock_client.execute_async.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_cached_query_skips_network(self):
+        """Test that repeated read queries are served from the cache."""
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.execute_async.return_value = {"maps": [{"id": "map-1", "name": "Customs"}]}
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                first = await client.get_maps()
+                first[0]["name"] = "mutated"
+                second = await client.get_maps()
+        
+        mock_client.execute_async.assert_awaited_once()
+        assert second[0]["name"] == "Customs"
+    
+    @pytest.mark.asyncio
+    async def test_uncached_query_without_waiters_is_not_copied(self):
+        """Test that a lone uncached query returns the response without snapshotting it."""
+        response = {"goonReports": [{"map": {"name": "Customs"}}]}
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class, \
+             patch('tarkov_mcp.graphql_client._json_dumps') as mock_dumps:
+            mock_client = AsyncMock()
+            mock_client.execute_async.return_value = response
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                result = await client.execute_query("query { goonReports { map { name } } }")
+        
+        assert result is response
+        mock_dumps.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_queries_share_request(self):
+        """Test that identical in-flight queries are sent only once."""
+        async def slow_response(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return {"goonReports": [{"map": {"name": "Customs"}}]}
+        
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.execute_async.side_effect = slow_response
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                first, second = await asyncio.gather(client.get_goon_reports(), client.get_goon_reports())
+        
+        mock_client.execute_async.assert_awaited_once()
+        assert first == second
+        assert first is not second
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_originator_does_not_cancel_waiters(self):
+        """Test that a joined query still completes when the caller that started it is cancelled."""
+        started = asyncio.Event()
+        calls = 0
+        
+        async def response(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                started.set()
+                await asyncio.sleep(10)
+            return {"goonReports": [{"map": {"name": "Customs"}}]}
+        
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.execute_async.side_effect = response
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                originator = asyncio.create_task(client.get_goon_reports())
+                await started.wait()
+                waiter = asyncio.create_task(client.get_goon_reports())
+                await asyncio.sleep(0)
+                originator.cancel()
+                result = await waiter
+        
+        assert originator.cancelled()
+        assert result[0]["map"]["name"] == "Customs"
+        assert calls == 2
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_capped(self):
+        """Test that no more than the configured number of requests run at once."""
+        active = 0
+        peak = 0
+        
+        async def tracked_response(*args, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return {"goonReports": []}
+        
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class, \
+             patch.object(config, 'MAX_CONCURRENT', 2), \
+             patch('tarkov_mcp.graphql_client._request_semaphore', None):
+            mock_client = AsyncMock()
+            mock_client.execute_async.side_effect = tracked_response
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                await asyncio.gather(*(client.get_goon_reports(limit=i) for i in range(1, 6)))
+        
+        assert mock_client.execute_async.await_count == 5
+        assert peak == 2
+    
+    def test_request_semaphore_follows_event_loop(self):
+        """Test that each event loop gets its own request semaphore."""
+        async def current_semaphore():
+            return get_request_semaphore(), get_request_semaphore()
+        
+        first, same = asyncio.run(current_semaphore())
+        second, _ = asyncio.run(current_semaphore())
+        
+        assert first is same
+        assert first is not second
+    
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self):
+        """Test that 5xx responses are retried and 4xx responses are not."""
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class, \
+             patch.object(config, 'RETRY_BACKOFF_S', 0):
+            mock_client = AsyncMock()
+            mock_client.execute_async.side_effect = [
+                TransportServerError("503 Service Unavailable", 503),
+                {"goonReports": [{"map": {"name": "Customs"}}]},
+                TransportServerError("400 Bad Request", 400),
+            ]
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                result = await client.get_goon_reports()
+                with pytest.raises(TransportServerError):
+                    await client.get_goon_reports(limit=5)
+        
+        assert result[0]["map"]["name"] == "Customs"
+        assert mock_client.execute_async.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_raw_post_bypasses_gql(self):
+        """Test that RAW_POST sends a pre-encoded body and unwraps the data."""
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class, \
+             patch.object(config, 'RAW_POST', True), \
+             patch('tarkov_mcp.graphql_client._post_json', AsyncMock(return_value={"data": {"item": {"id": "test-id"}}})) as mock_post:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                result = await client.get_item_by_id("test-id")
+        
+        assert result == {"id": "test-id"}
+        mock_client.execute_async.assert_not_called()
+        body = json.loads(mock_post.call_args.args[0])
+        assert body["variables"] == {"id": "test-id"}
+        assert "query GetItem" in body["query"]
+    
+    @pytest.mark.asyncio
+    async def test_warm_cache_prefetches_reference_data(self):
+        """Test that warm_cache fetches one bundle that later single lookups are served from."""
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.execute_async.return_value = {
+                "maps": [{"id": "map-1", "name": "Customs"}],
+                "traders": [{"id": "trader-1", "name": "Prapor"}],
+            }
+            mock_client_class.return_value = mock_client
+            
+            await warm_cache()
+            async with TarkovGraphQLClient() as client:
+                maps = await client.get_maps()
+                traders = await client.get_traders()
+        
+        mock_client.execute_async.assert_awaited_once()
+        assert maps[0]["name"] == "Customs"
+        assert traders[0]["name"] == "Prapor"
+    
+    @pytest.mark.asyncio
+    async def test_warm_cache_keeps_traders_on_short_ttl(self):
+        """Test that warmed trader data expires with prices, not with the 24h static data."""
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class, \
+             patch.object(config, 'CACHE_TTL_PRICES', 0):
+            mock_client = AsyncMock()
+            mock_client.execute_async.side_effect = [
+                {"maps": [{"id": "map-1", "name": "Customs"}], "traders": [{"id": "trader-1", "resetTime": "old"}]},
+                {"traders": [{"id": "trader-1", "resetTime": "new"}]},
+            ]
+            mock_client_class.return_value = mock_client
+            
+            await warm_cache()
+            async with TarkovGraphQLClient() as client:
+                await client.get_maps()
+                traders = await client.get_traders()
+        
+        assert mock_client.execute_async.await_count == 2
+        assert traders[0]["resetTime"] == "new"
+    
+    @pytest.mark.asyncio
+    async def test_persisted_query_registers_on_miss(self):
+        """Test that an unknown query hash is retried with the full query text."""
+        responses = [
+            {"errors": [{"message": "PersistedQueryNotFound"}]},
+            {"data": {"item": {"id": "test-id"}}},
+        ]
+        
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class, \
+             patch.object(config, 'RAW_POST', True), \
+             patch.object(config, 'PERSISTED_QUERIES', True), \
+             patch('tarkov_mcp.graphql_client._post_json', AsyncMock(side_effect=responses)) as mock_post:
+            mock_client_class.return_value = AsyncMock()
+            
+            async with TarkovGraphQLClient() as client:
+                result = await client.get_item_by_id("test-id")
+        
+        assert result == {"id": "test-id"}
+        hashed, full = (json.loads(call.args[0]) for call in mock_post.call_args_list)
+        assert "query" not in hashed
+        assert hashed["extensions"]["persistedQuery"]["sha256Hash"] == hashlib.sha256(full["query"].encode()).hexdigest()
+        assert full["extensions"] == hashed["extensions"]
+    
+    @pytest.mark.asyncio
+    async def test_raw_post_revalidates_with_etag(self):
+        """Test that a repeated raw POST sends If-None-Match and reuses the body on 304."""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+        from tarkov_mcp.graphql_client import _post_json
+
+        seen = []
+
+        async def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return web.json_response({"data": {"maps": []}}, headers={"ETag": '"v1"'})
+
+        app = web.Application()
+        app.router.add_post("/graphql", handler)
+        async with TestServer(app) as server:
+            with patch.object(config, 'TARKOV_API_URL', str(server.make_url("/graphql"))), \
+                 patch.dict('tarkov_mcp.graphql_client._etags', clear=True):
+                first = await _post_json(b'{"query":"{ maps { id } }"}')
+                second = await _post_json(b'{"query":"{ maps { id } }"}')
+        await close_connector()
+
+        assert seen == [None, '"v1"']
+        assert first == second == {"data": {"maps": []}}
+    
+    @pytest.mark.asyncio
+    async def test_fetch_bundle_aliases_root_fields(self):
+        """Test that fetch_bundle sends one aliased operation and splits the response."""
+        with patch('tarkov_mcp.graphql_client.Client') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.execute_async.return_value = {
+                "hideout": [{"id": "station-1", "name": "Lavatory"}],
+                "maps": [{"id": "map-1", "name": "Customs"}],
+            }
+            mock_client_class.return_value = mock_client
+            
+            async with TarkovGraphQLClient() as client:
+                bundle = await client.fetch_bundle("maps", "hideout")
+                with pytest.raises(ValueError):
+                    await client.fetch_bundle("maps", "bogus")
+        
+        assert bundle["maps"][0]["name"] == "Customs"
+        assert bundle["hideout"][0]["name"] == "Lavatory"
+        request = mock_client.execute_async.call_args.args[0]
+        query = print_ast(getattr(request, "document", request))
+        assert "hideout: hideoutStations" in query
+        assert "maps: maps" in query
+    
+    def test_ttl_cache_expiry_and_eviction(self):
+        """Test that entries expire after their TTL and the oldest are evicted when full."""
+        cache = TTLCache(max_entries=2)
+        cache.set(("a",), 1, ttl=60)
+        cache.set(("b",), 2, ttl=60)
+        cache.get(("a",))
+        cache.set(("c",), 3, ttl=60)
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == 1
+        
+        cache.set(("d",), 4, ttl=-1)
+        assert cache.get(("d",)) is None
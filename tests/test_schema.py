@@ -0,0 +1,31 @@
+"""Tests for schema parsing helpers."""
+
+from tarkov_mcp.schema import parse_items_from_api
+
+
+class TestParseItemsFromApi:
+    """Test batch item parsing."""
+
+    def test_vendors_shared_across_rows(self):
+        """Test that identical price vendors parse to one shared Trader object."""
+        rows = [
+            {"id": "a", "name": "A", "sellFor": [{"vendor": {"name": "Prapor", "normalizedName": "prapor"}, "price": 100}]},
+            {"id": "b", "name": "B", "sellFor": [{"vendor": {"name": "Prapor", "normalizedName": "prapor"}, "price": 200}]},
+        ]
+
+        first, second = parse_items_from_api(rows)
+
+        assert first.sell_for[0].vendor is second.sell_for[0].vendor
+        assert first.sell_for[0].vendor.name == "Prapor"
+
+    def test_vendors_with_nested_fields_are_parsed(self):
+        """Test that vendors carrying nested objects or unhashable values still parse."""
+        rows = [
+            {"id": "a", "name": "A", "sellFor": [{"vendor": {"name": "Flea Market", "trader": {"id": "t"}}, "price": 100}]},
+            {"id": "b", "name": "B", "sellFor": [{"vendor": {"name": ["Flea Market"]}, "price": 200}]},
+        ]
+
+        first, second = parse_items_from_api(rows)
+
+        assert first.sell_for[0].vendor.name == "Flea Market"
+        assert second.sell_for[0].vendor.name == ["Flea Market"]
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from mcp.types import TextContent, Tool
+import mcp.types as types
 
 from tarkov_mcp.server import TarkovMCPServer
 
@@ -130,6 +131,41 @@ class TestTarkovMCPServer:
             assert len(result) == 1
             assert "Error searching items" in result[0].text
     
+    def test_argument_validation(self, server):
+        """Test tool arguments are checked against the precompiled input schemas."""
+        assert set(server._validators) == {tool.name for tool in server.all_tools}
+        assert server._validate_arguments("get_goon_reports", {"limit": 10}) is None
+        
+        error = server._validate_arguments("get_goon_reports", {"limit": 500})
+        assert error is not None
+        assert "Input validation error" in error
+        
+        error = server._validate_arguments("get_item_details", {})
+        assert error is not None
+        assert "item_id" in error
+        
+        assert server._validate_arguments("get_item_prices", {"item_names": ["AK-74"] * 20}) is None
+        assert server._validate_arguments("get_item_prices", {"item_names": ["AK-74"] * 21}) is not None
+        assert server._validate_arguments("compare_items", {"item_ids": ["id"] * 21}) is not None
+    
+    @pytest.mark.asyncio
+    async def test_invalid_arguments_flagged_as_error(self, server):
+        """Test that a call with invalid arguments comes back with isError set."""
+        handler = server.server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name="get_goon_reports", arguments={"limit": 500})
+        )
+        
+        result = (await handler(request)).root
+        
+        assert result.isError is True
+        assert "Input validation error" in result.content[0].text
+    
+    def test_every_tool_has_a_handler(self, server):
+        """Test the dispatch table routes every listed tool."""
+        assert set(server._handlers) == {tool.name for tool in server.all_tools}
+    
     @pytest.mark.asyncio 
     async def test_language_support_integration(self, server):
         """Test language support is properly integrated."""
@@ -51,7 +51,7 @@ class TestItemTools:
             
             result = await item_tools.handle_search_items({"name": "AK", "limit": 10})
             
-            mock_client.search_items.assert_called_once_with(name="AK", item_type=None, limit=10, lang="en")
+            mock_client.search_items.assert_called_once_with(name="AK", item_type=None, limit=10, lang="en", fields=("prices",))
             
             assert len(result) == 1
             assert isinstance(result[0], TextContent)
@@ -180,6 +180,7 @@ class TestMarketTools:
             
             result = await market_tools.handle_get_flea_market_data({"limit": 10})
             
+            mock_client.get_flea_market_data.assert_called_once_with(limit=10, fields=())
             assert len(result) == 1
             assert isinstance(result[0], TextContent)
             text = result[0].text
@@ -371,7 +372,7 @@ class TestItemToolsExtended:
         with patch('tarkov_mcp.tools.items.TarkovGraphQLClient') as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_client.search_items.return_value = mock_items
+            mock_client.search_items_batch.return_value = mock_items
             
             result = await item_tools.handle_get_item_prices({"item_names": ["AK-74"]})
             
@@ -379,6 +380,7 @@ class TestItemToolsExtended:
             assert "AK-74" in result[0].text
             assert "₽25,000" in result[0].text
             assert "+5.2%" in result[0].text
+            mock_client.search_items_batch.assert_called_once_with(["AK-74"], fields=("prices",))
 
     @pytest.mark.asyncio
     async def test_compare_items_success(self, item_tools):
@@ -407,7 +409,7 @@ class TestItemToolsExtended:
         with patch('tarkov_mcp.tools.items.TarkovGraphQLClient') as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_client.get_item_by_id.side_effect = mock_items
+            mock_client.get_items_by_ids.return_value = mock_items
             
             result = await item_tools.handle_compare_items({"item_ids": ["item1", "item2"]})
             
@@ -445,7 +447,7 @@ class TestItemToolsExtended:
             
             result = await item_tools.handle_search_items({"name": "AK", "language": "ru", "limit": 10})
             
-            mock_client.search_items.assert_called_once_with(name="AK", item_type=None, limit=10, lang="ru")
+            mock_client.search_items.assert_called_once_with(name="AK", item_type=None, limit=10, lang="ru", fields=("prices",))
             assert len(result) == 1
             assert "AK-74" in result[0].text
     
@@ -3,11 +3,18 @@
 import pytest                                                                                                                                                 
 import asyncio                                                                                                                                                
 from unittest.mock import AsyncMock, patch, MagicMock                                                                                                         
-from tarkov_mcp.graphql_client import TarkovGraphQLClient, RateLimiter                                                                                               
+from tarkov_mcp.graphql_client import TarkovGraphQLClient, RateLimiter, get_cache                                                                                               
                                                                                                                                                               
 # Set timeout for all async tests to prevent hanging                                                                                                          
 pytestmark = pytest.mark.timeout(30) 
 
+@pytest.fixture(autouse=True)
+def clear_query_cache():
+    """Start every test with an empty query cache."""
+    get_cache().clear()
+    yield
+    get_cache().clear()
+
 class TestRateLimiter:
     """Test rate limiter functionality."""
     
@@ -20,13 +27,13 @@ class TestRateLimiter:
         for _ in range(5):
             await limiter.acquire()
         
-        # Check that we have 5 requests recorded
-        assert len(limiter.requests) == 5
+        # Check that the bucket has been drained
+        assert limiter._tokens < 1
     
     @pytest.mark.asyncio                                                                                                                                      
     async def test_rate_limiter_blocks_excess_requests(self):                                                                                                 
         """Test that rate limiter blocks requests over the limit."""                                                                                          
-        limiter = RateLimiter(max_requests=2, time_window=0.1)  # Use shorter time window                                                                     
+        limiter = RateLimiter(max_requests=2, time_window=0.2)  # 2 tokens per 0.2s refills one token every 0.1s                                                                     
                                                                                                                                                               
         # Allow 2 requests                                                                                                                                    
         await limiter.acquire()                                                                                                                               
@@ -37,7 +44,7 @@ class TestRateLimiter:
         await limiter.acquire()                                                                                                                               
         end_time = asyncio.get_event_loop().time()                                                                                                            
                                                                                                                                                               
-        # Should have been delayed by approximately 0.1 seconds                                                                                               
+        # Should have waited about 0.1s for the token bucket to refill one token                                                                                               
         assert end_time - start_time >= 0.05  # Allow some tolerance  
 
 class TestTarkovGraphQLClient: